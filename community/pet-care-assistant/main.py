@@ -1,10 +1,24 @@
 import asyncio
+import bisect
+import difflib
+import functools
+import hashlib
+import itertools
 import json
+import random
 import re
-import uuid
-from datetime import datetime, timedelta
+import secrets
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+try:
+    import orjson  # Optional: faster encode/decode of data files and payloads
+except ImportError:
+    orjson = None
 
-import requests
 from src.agent.capability import MatchingCapability
 from src.agent.capability_worker import CapabilityWorker
 from src.main import AgentWorker
@@ -59,6 +73,9 @@ class PetDataService:
     def __init__(self, capability_worker, worker):
         self.capability_worker = capability_worker
         self.worker = worker
+        # filename -> text last read or written by this service, so a save
+        # can write the backup without reading the file back first
+        self._disk_copies = {}
 
     async def load_json(self, filename, default=None):
         backup_filename = f"{filename}.backup"
@@ -67,7 +84,9 @@ class PetDataService:
                 raw = await self.capability_worker.read_file(filename, False)
                 if not raw or not raw.strip():
                     return default if default is not None else {}
-                return json.loads(raw)
+                data = await _loads(raw)
+                self._disk_copies[filename] = raw
+                return data
             except json.JSONDecodeError:
                 self.worker.editor_logging_handler.error(
                     f"[PetCare] Corrupt file {filename}, trying backup."
@@ -77,13 +96,13 @@ class PetDataService:
             try:
                 raw = await self.capability_worker.read_file(backup_filename, False)
                 if raw and raw.strip():
-                    data = json.loads(raw)
+                    data = await _loads(raw)
                     self.worker.editor_logging_handler.info(
                         f"[PetCare] Recovered {filename} from backup."
                     )
-                    await self.capability_worker.write_file(
-                        filename, json.dumps(data), False
-                    )
+                    content = _compact_json(data)
+                    await self.capability_worker.write_file(filename, content, False)
+                    self._disk_copies[filename] = content
                     await self.capability_worker.delete_file(backup_filename, False)
                     return data
             except (json.JSONDecodeError, Exception) as e:
@@ -95,18 +114,35 @@ class PetDataService:
 
     async def save_json(self, filename, data):
         backup_filename = f"{filename}.backup"
+        # The SDK has no rename, so the previous contents are parked in a
+        # backup while the file is rewritten. Only a backup made here needs
+        # removing afterwards; load_json reads a leftover one only when the
+        # main file is missing or corrupt.
+        backed_up = False
+        content = _compact_json(data)
+        # Unknown until the write below lands; dropped so a failure can't
+        # leave a wrong copy behind.
+        previous = self._disk_copies.pop(filename, None)
         try:
             if await self.capability_worker.check_if_file_exists(filename, False):
-                content = await self.capability_worker.read_file(filename, False)
-                await self.capability_worker.write_file(backup_filename, content, False)
+                if previous is None:
+                    previous = await self.capability_worker.read_file(filename, False)
+                # write_file appends, so a leftover backup must go first
+                if await self.capability_worker.check_if_file_exists(
+                    backup_filename, False
+                ):
+                    await self.capability_worker.delete_file(backup_filename, False)
+                await self.capability_worker.write_file(
+                    backup_filename, previous, False
+                )
+                backed_up = True
                 self.worker.editor_logging_handler.info(
                     f"[PetCare] Created backup: {backup_filename}"
                 )
                 await self.capability_worker.delete_file(filename, False)
-            await self.capability_worker.write_file(filename, json.dumps(data), False)
-            if await self.capability_worker.check_if_file_exists(
-                backup_filename, False
-            ):
+            await self.capability_worker.write_file(filename, content, False)
+            self._disk_copies[filename] = content
+            if backed_up:
                 await self.capability_worker.delete_file(backup_filename, False)
                 self.worker.editor_logging_handler.info(
                     f"[PetCare] Successfully saved {filename}, backup cleaned up"
@@ -123,25 +159,137 @@ class PetDataService:
                 )
             raise
 
-    def resolve_pet(self, pet_data, pet_name=None):
+    async def load_jsonl(self, filename, tail=None):
+        """Load a JSON-lines file oldest-first, skipping unreadable lines.
+
+        Args:
+            filename: File to read.
+            tail: If set, only the last ``tail`` lines are decoded; older
+                lines are counted but never parsed.
+
+        Returns:
+            (entries, line_count) — line_count is the number of non-empty
+            lines in the file, including any left undecoded.
+        """
+        backup_filename = f"{filename}.backup"
+        if await self.capability_worker.check_if_file_exists(filename, False):
+            raw = await self.capability_worker.read_file(filename, False)
+        elif await self.capability_worker.check_if_file_exists(
+            backup_filename, False
+        ):
+            # A save_jsonl rewrite failed after the delete; the backup holds
+            # the last complete file.
+            raw = await self.capability_worker.read_file(backup_filename, False)
+            if raw and raw.strip():
+                await self.capability_worker.write_file(filename, raw, False)
+            await self.capability_worker.delete_file(backup_filename, False)
+            self.worker.editor_logging_handler.info(
+                f"[PetCare] Recovered {filename} from backup."
+            )
+        else:
+            return [], 0
+        lines = [line for line in (raw or "").splitlines() if line.strip()]
+        selected = lines[-tail:] if tail else lines
+        # Decode every line in one C-level parse; only a file with a bad line
+        # pays for the per-line pass that finds and skips it.
+        try:
+            entries = await _loads(f"[{','.join(selected)}]")
+            if len(entries) == len(selected):
+                return entries, len(lines)
+        except json.JSONDecodeError:
+            pass
+        entries = []
+        skipped = 0
+        for line in selected:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                skipped += 1
+        if skipped:
+            self.worker.editor_logging_handler.warning(
+                f"[PetCare] Skipped {skipped} unreadable lines in {filename}"
+            )
+        return entries, len(lines)
+
+    async def append_jsonl(self, filename, entry):
+        """Append one entry as a JSON line (write_file appends by default)."""
+        await self.capability_worker.write_file(
+            filename, _compact_json(entry) + "\n", False
+        )
+
+    async def save_jsonl(self, filename, entries):
+        """Rewrite a JSON-lines file from scratch with the given entries.
+
+        Uses the same backup-write-delete sequence as save_json, so a failed
+        rewrite leaves the previous file for load_jsonl to recover.
+        """
+        backup_filename = f"{filename}.backup"
+        backed_up = False
+        content = "".join(_compact_json(e) + "\n" for e in entries)
+        try:
+            if await self.capability_worker.check_if_file_exists(filename, False):
+                previous = await self.capability_worker.read_file(filename, False)
+                # write_file appends, so a leftover backup must go first
+                if await self.capability_worker.check_if_file_exists(
+                    backup_filename, False
+                ):
+                    await self.capability_worker.delete_file(backup_filename, False)
+                await self.capability_worker.write_file(
+                    backup_filename, previous, False
+                )
+                backed_up = True
+                await self.capability_worker.delete_file(filename, False)
+            if content:
+                await self.capability_worker.write_file(filename, content, False)
+            if backed_up:
+                await self.capability_worker.delete_file(backup_filename, False)
+        except Exception as e:
+            self.worker.editor_logging_handler.error(
+                f"[PetCare] Failed to save {filename}: {e}"
+            )
+            if backed_up:
+                self.worker.editor_logging_handler.warning(
+                    f"[PetCare] Backup file {backup_filename} retained for recovery"
+                )
+            raise
+
+    @staticmethod
+    def match_pet_name(pets, pet_name, by_name=None):
+        """Find a pet by exact (case-insensitive) name, then by name prefix.
+
+        ``by_name`` is an optional lowercased-name -> pet index; when given,
+        neither match re-lowercases the stored names.
+        """
+        name_lower = pet_name.lower().strip()
+        if by_name is None:
+            # Same first-pet-wins order as _index_pets
+            by_name = {}
+            for p in pets:
+                by_name.setdefault(p["name"].lower(), p)
+        exact = by_name.get(name_lower)
+        if exact is not None:
+            return exact
+        # Prefix match either way round, over the already-lowercased names
+        for name, p in by_name.items():
+            if name.startswith(name_lower) or name_lower.startswith(name):
+                return p
+        return None
+
+    def resolve_pet(self, pet_data, pet_name=None, by_name=None):
         pets = pet_data.get("pets", [])
         if not pets:
             return None
         if len(pets) == 1:
             return pets[0]
         if pet_name:
-            name_lower = pet_name.lower().strip()
-            for p in pets:
-                if p["name"].lower() == name_lower:
-                    return p
-            for p in pets:
-                if p["name"].lower().startswith(name_lower) or name_lower.startswith(
-                    p["name"].lower()
-                ):
-                    return p
+            match = self.match_pet_name(pets, pet_name, by_name)
+            if match is not None:
+                return match
         return pets[0]
 
-    async def resolve_pet_async(self, pet_data, pet_name=None, is_exit_fn=None):
+    async def resolve_pet_async(
+        self, pet_data, pet_name=None, is_exit_fn=None, by_name=None
+    ):
         pets = pet_data.get("pets", [])
         if not pets:
             await self.capability_worker.speak("You don't have any pets set up yet.")
@@ -149,20 +297,14 @@ class PetDataService:
         if len(pets) == 1:
             return pets[0]
         if pet_name:
-            name_lower = pet_name.lower().strip()
-            for p in pets:
-                if p["name"].lower() == name_lower:
-                    return p
-            for p in pets:
-                if p["name"].lower().startswith(name_lower) or name_lower.startswith(
-                    p["name"].lower()
-                ):
-                    return p
+            match = self.match_pet_name(pets, pet_name, by_name)
+            if match is not None:
+                return match
         names = " or ".join(p["name"] for p in pets)
         await self.capability_worker.speak(f"Which pet? {names}?")
         response = await self.capability_worker.user_response()
         if response and (not is_exit_fn or not is_exit_fn(response)):
-            return self.resolve_pet(pet_data, response)
+            return self.resolve_pet(pet_data, response, by_name)
         return None
 
 
@@ -170,36 +312,58 @@ class PetDataService:
 # LLM Service
 # ===========================================================================
 
-_FORCE_EXIT_PHRASES = [
+_FORCE_EXIT_PHRASES = (
     "exit petcare",
     "close petcare",
     "shut down pets",
     "petcare out",
-]
-
-_EXIT_COMMANDS = ["exit", "stop", "quit", "cancel"]
-
-_EXIT_RESPONSES = [
-    "no",
-    "nope",
-    "done",
-    "bye",
-    "goodbye",
-    "thanks",
-    "thank you",
-    "no thanks",
-    "nothing else",
-    "all good",
-    "i'm good",
-    "that's all",
-    "that's it",
-    "i'm done",
-    "we're done",
-]
+)
+# One alternation scan instead of a substring test per phrase
+_RE_FORCE_EXIT = re.compile("|".join(map(re.escape, _FORCE_EXIT_PHRASES)))
+
+# Exit commands match as whole words anywhere in the input
+_EXIT_COMMANDS = frozenset({"exit", "stop", "quit", "cancel"})
+
+# Exit responses match the whole input or its leading words
+_EXIT_RESPONSES = frozenset(
+    {
+        "no",
+        "nope",
+        "done",
+        "bye",
+        "goodbye",
+        "thanks",
+        "thank you",
+        "no thanks",
+        "nothing else",
+        "all good",
+        "i'm good",
+        "that's all",
+        "that's it",
+        "i'm done",
+        "we're done",
+    }
+)
+_EXIT_RESPONSE_MAX_WORDS = max(len(r.split()) for r in _EXIT_RESPONSES)
+
+# Substring phrases that abort onboarding back to a fresh start
+_RESET_PHRASES = (
+    "start over",
+    "start from scratch",
+    "restart",
+    "reset everything",
+    "start from beginning",
+)
+_RE_RESET = re.compile("|".join(map(re.escape, _RESET_PHRASES)))
+# "Cancel Luna's walk reminder" deletes a reminder; it is not an exit even
+# though it is short and says "cancel".
+_RE_REMINDER_WORD = re.compile(r"\bremind(?:ers?)?\b")
 
+# The per-user pet list is the last line, so everything before it is a
+# byte-identical prefix across users and sessions (provider prefix caching).
 _CLASSIFY_PROMPT = (
     "You are an intent classifier for a pet care assistant. "
-    "The user manages one or more pets. Known pets: {pet_names}.\n\n"
+    "The user manages one or more pets; their names are listed at the end.\n\n"
     "CRITICAL INSTRUCTIONS:\n"
     "1. Input comes from speech-to-text and WILL be garbled, noisy, or incomplete. "
     "Always try to infer the most plausible intent, even from fragments.\n"
@@ -262,34 +426,177 @@ _CLASSIFY_PROMPT = (
     '"Any pet food recalls?" -> {{"mode": "food_recall"}}\n'
     '"Start over" -> {{"mode": "edit_pet", "action": "reset_all", "pet_name": null, "details": "reset all data"}}\n'
     '"Remind me to feed Luna in 2 hours" -> {{"mode": "reminder", "action": "set", "pet_name": "Luna", "activity": "feeding", "time_description": "in 2 hours"}}\n'
-    '"pet care" -> {{"mode": "greeting"}}\n'
+    '"Cancel Luna\'s walk reminder" -> {{"mode": "reminder", "action": "delete", "pet_name": "Luna", "activity": "walk", "time_description": null}}\n'
+    '"pet care" -> {{"mode": "greeting"}}\n\n'
+    "Known pets: {pet_names}."
 )
 
 
+# Precompiled patterns shared by the input cleaners and LLM reply parsers
+_RE_FENCE_OPEN = re.compile(r"^```[\w-]*\s*")
+_RE_FENCE_CLOSE = re.compile(r"\s*```$")
+_RE_PUNCT = re.compile(r"[^\w\s']")
+# ASCII characters _RE_PUNCT removes, for the bytes.translate fast path
+_ASCII_PUNCT = bytes(c for c in range(128) if _RE_PUNCT.fullmatch(chr(c)))
+_RE_NON_DIGIT = re.compile(r"\D")
+_RE_INT = re.compile(r"\d+")
+_RE_WHITESPACE = re.compile(r"\s+")
+# ISP names that mean ip-api saw a data-center address, not the user's
+_RE_CLOUD_ISP = re.compile(r"amazon|aws|google|microsoft|azure|digitalocean", re.I)
+_RE_LEADING_NO = re.compile(r"^(?:no[,.]?|nope[,.]?|nah[,.]?)\s*", re.IGNORECASE)
+
+
+# Unambiguous, pet-independent requests resolved without the classifier LLM.
+# The whole utterance must be the command phrase, give or take some filler,
+# so "remind me to find a vet", "does Luna need a vet" and "I took Luna to
+# the vet near me" all go to the LLM as before.
+_FAST_LEAD = r"(?:(?:hey|ok|okay|please|can you|could you|help me|i need to)\s+)*"
+_FAST_TAIL = r"(?:\s+(?:please|now|right now|for me))?"
+_FAST_INTENTS = (
+    (
+        re.compile(
+            _FAST_LEAD
+            + r"(?:find (?:me )?(?:an? |the nearest )?(?:emergency )?vet(?: near me)?"
+            r"|(?:an? |the )?(?:nearest|emergency) (?:emergency )?vet(?: near me)?"
+            r"|(?:i )?need an? (?:emergency )?vet|vet near me)"
+            + _FAST_TAIL
+        ),
+        {"mode": "emergency_vet"},
+    ),
+    (
+        re.compile(
+            _FAST_LEAD
+            + r"(?:(?:check (?:for )?|any )?(?:pet )?food recalls?"
+            r"|(?:run an? |do an? )?recall check"
+            r"|(?:are there )?any recalls|check (?:for )?recalls)"
+            + _FAST_TAIL
+        ),
+        {"mode": "food_recall"},
+    ),
+)
+
+
+def _strip_punct(text: str) -> str:
+    """Remove punctuation as _RE_PUNCT does, without the regex engine for ASCII.
+
+    Transcripts are almost always ASCII, where a byte-table delete is a few
+    times faster; anything else takes the Unicode-aware regex.
+    """
+    if text.isascii():
+        return text.encode("ascii").translate(None, _ASCII_PUNCT).decode("ascii")
+    return _RE_PUNCT.sub("", text)
+
+
+def _fast_classify(user_input: str) -> dict | None:
+    """Return an intent for obvious keyword requests, or None to use the LLM."""
+    text = " ".join(_strip_punct((user_input or "").lower()).split())
+    for pattern, intent in _FAST_INTENTS:
+        if pattern.fullmatch(text):
+            return dict(intent)
+    return None
+
+
+# Well-formed onboarding answers are parsed locally; anything with more
+# than one number, or a unit these parsers don't know, goes to the LLM.
+# A weight may only be followed by a known unit and punctuation, so "she is
+# 3 years old" is not read as 3 lbs.
+_RE_WEIGHT = re.compile(
+    r"^\D*?(\d+(?:\.\d+)?)\s*(kg|kgs|kilos?|kilograms?|lbs?|pounds?)?[\s.,!?]*$"
+)
+_RE_WEIGHT_OTHER_UNITS = re.compile(r"\b(?:oz|ounces?|g|grams?|stone)\b|half")
+_RE_ISO_DATE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_RE_AGE = re.compile(r"^\D*?(\d+)\s*(years?|yrs?|months?)\b\D*$")
+KG_TO_LBS = 2.20462
+
+
+def _parse_weight_lbs(text: str) -> str | None:
+    """Parse "20 lbs" / "9 kg" / "about 20" as a pounds string, or None."""
+    text = (text or "").lower()
+    match = _RE_WEIGHT.match(text)
+    if not match or _RE_WEIGHT_OTHER_UNITS.search(text):
+        return None
+    value = float(match.group(1))
+    if (match.group(2) or "").startswith("k"):
+        value *= KG_TO_LBS
+    return f"{round(value, 1):g}"
+
+
+def _parse_birthday(text: str, today=None) -> str | None:
+    """Parse an ISO date or "3 years old" / "8 months old" as YYYY-MM-DD."""
+    text = (text or "").lower()
+    iso = _RE_ISO_DATE.search(text)
+    if iso:
+        try:
+            return datetime(*map(int, iso.groups())).date().isoformat()
+        except ValueError:
+            return None
+    match = _RE_AGE.match(text)
+    if not match or "half" in text:
+        return None
+    today = today or datetime.now().date()
+    count = int(match.group(1))
+    months = count if match.group(2).startswith("m") else count * 12
+    year, month = divmod(today.year * 12 + today.month - 1 - months, 12)
+    try:
+        return today.replace(year=year, month=month + 1).isoformat()
+    except ValueError:  # e.g. March 31 minus one month; the date is approximate
+        return today.replace(year=year, month=month + 1, day=28).isoformat()
+
+
+def _parse_phone_digits(text: str) -> str | None:
+    """Return the digits of a 10/11-digit phone number, or None."""
+    digits = _RE_NON_DIGIT.sub("", text or "")
+    return digits if len(digits) in (10, 11) else None
+
+
 def _strip_llm_fences(text):
+    """Strip markdown code fences (```json ... ```, any tag) from LLM output."""
     text = text.strip()
-    text = re.sub(r"^```(?:json)?\s*", "", text)
-    text = re.sub(r"\s*```$", "", text)
+    text = _RE_FENCE_OPEN.sub("", text)
+    text = _RE_FENCE_CLOSE.sub("", text)
     return text.strip()
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_first_object(text):
+    """Decode the first JSON object in LLM output, ignoring anything after it.
+
+    The reply is only available once complete, but decoding stops at the end
+    of the object, so trailing prose or a stray fence doesn't fail the parse.
+    """
+    text = _strip_llm_fences(text)
+    return _JSON_DECODER.raw_decode(text, max(text.find("{"), 0))[0]
+
+
 class LLMService:
     def __init__(self, capability_worker, worker, pet_data):
         self.capability_worker = capability_worker
         self.worker = worker
         self.pet_data = pet_data
+        # Filled classifier prompt and the pet names it was filled with
+        self._classify_prompt = ""
+        self._classify_prompt_names = None
+        self._extract_cache = OrderedDict()
+
+    def classify_system_prompt(self):
+        """Return the filled classifier prompt, re-formatted only when pet names change."""
+        names = tuple(p["name"] for p in self.pet_data.get("pets", []))
+        if names != self._classify_prompt_names:
+            self._classify_prompt = _CLASSIFY_PROMPT.format(
+                pet_names=", ".join(names) if names else "none",
+            )
+            self._classify_prompt_names = names
+        return self._classify_prompt
 
     def classify_intent(self, user_input):
-        pet_names = [p["name"] for p in self.pet_data.get("pets", [])]
-        prompt_filled = _CLASSIFY_PROMPT.format(
-            pet_names=", ".join(pet_names) if pet_names else "none",
-        )
         try:
             raw = self.capability_worker.text_to_text_response(
                 f"User said: {user_input}",
-                system_prompt=prompt_filled,
+                system_prompt=self.classify_system_prompt(),
             )
-            return json.loads(_strip_llm_fences(raw))
+            return _decode_first_object(raw)
         except (json.JSONDecodeError, Exception) as e:
             self.worker.editor_logging_handler.error(
                 f"[PetCare] Classification error: {e}"
@@ -297,23 +604,96 @@ class LLMService:
             return {"mode": "unknown"}
 
     async def classify_intent_async(self, user_input):
+        fast = _fast_classify(user_input)
+        if fast is not None:
+            self.worker.editor_logging_handler.info(
+                f"[PetCare] Fast-path intent: {fast['mode']}"
+            )
+            return fast
         return await asyncio.to_thread(self.classify_intent, user_input)
 
     def extract_value(self, raw_input, instruction):
         if not raw_input:
             return ""
+        key = (raw_input, instruction)
+        if key in self._extract_cache:
+            self._extract_cache.move_to_end(key)
+            return self._extract_cache[key]
         try:
             result = self.capability_worker.text_to_text_response(
                 f"Input: {raw_input}",
                 system_prompt=instruction,
             )
-            return _strip_llm_fences(result).strip().strip('"')
         except Exception:
             return raw_input.strip()
+        value = _strip_llm_fences(result).strip().strip('"')
+        self._extract_cache[key] = value
+        if len(self._extract_cache) > MAX_EXTRACT_CACHE:
+            self._extract_cache.popitem(last=False)
+        return value
 
     async def extract_value_async(self, raw_input, instruction):
         return await asyncio.to_thread(self.extract_value, raw_input, instruction)
 
+    def extract_fields(self, raw_input, system_prompt):
+        """Run one structured extraction; return the parsed dict or None."""
+        try:
+            result = self.capability_worker.text_to_text_response(
+                raw_input, system_prompt=system_prompt
+            )
+            data = _decode_first_object(result)
+        except Exception as e:
+            self.worker.editor_logging_handler.warning(
+                f"[PetCare] Structured extraction failed: {e}"
+            )
+            return None
+        return data if isinstance(data, dict) else None
+
+    async def extract_overview_async(self, raw_input):
+        """Extract name, species, breed, birthday and weight in one call.
+
+        Returns the same strings the single-field extractors produce, or
+        None when the reply is not a JSON object so callers can fall back.
+        """
+        data = await asyncio.to_thread(
+            self.extract_fields,
+            f"Input: {raw_input}\nToday's date: {datetime.now().date().isoformat()}",
+            OVERVIEW_EXTRACT_PROMPT,
+        )
+        if data is None:
+            return None
+
+        def _text(key, default):
+            value = data.get(key)
+            if isinstance(value, str) and value.strip():
+                return value.strip()
+            return default
+
+        weight = data.get("weight_lbs")
+        if isinstance(weight, (int, float)) and not isinstance(weight, bool):
+            weight = str(weight)
+        return (
+            _text("name", ""),
+            _text("species", "unknown"),
+            _text("breed", "unknown"),
+            _text("birthday", ""),
+            weight.strip() if isinstance(weight, str) else "",
+        )
+
+    async def extract_health_async(self, raw_input):
+        """Extract (allergies, medications) lists in one call, or None."""
+        data = await asyncio.to_thread(
+            self.extract_fields, f"Input: {raw_input}", HEALTH_EXTRACT_PROMPT
+        )
+        if data is None:
+            return None
+        allergies = data.get("allergies")
+        medications = data.get("medications")
+        return (
+            allergies if isinstance(allergies, list) else [],
+            medications if isinstance(medications, list) else [],
+        )
+
     async def extract_pet_name_async(self, raw_input):
         return await self.extract_value_async(
             raw_input, "Extract the pet's name from this. Return just the name."
@@ -342,7 +722,7 @@ class LLMService:
             raw_input,
             "Extract a birthday in YYYY-MM-DD format if possible. "
             "If they give an age like '3 years old', calculate the approximate birthday "
-            f"from today ({datetime.now().strftime('%Y-%m-%d')}). "
+            f"from today ({datetime.now().date().isoformat()}). "
             "Return just the date string.",
         )
 
@@ -390,7 +770,7 @@ class LLMService:
         if not text:
             return ""
         cleaned = text.lower().strip()
-        cleaned = re.sub(r"[^\w\s']", "", cleaned)
+        cleaned = _strip_punct(cleaned)
         return cleaned.strip()
 
     def is_exit(self, text):
@@ -399,19 +779,15 @@ class LLMService:
         cleaned = self.clean_input(text)
         if not cleaned:
             return False
-        for phrase in _FORCE_EXIT_PHRASES:
-            if phrase in cleaned:
-                return True
+        if _RE_FORCE_EXIT.search(cleaned):
+            return True
         words = cleaned.split()
-        for cmd in _EXIT_COMMANDS:
-            if cmd in words:
-                return True
-        for resp in _EXIT_RESPONSES:
-            if cleaned == resp:
-                return True
-            if cleaned.startswith(f"{resp} "):
-                return True
-        return False
+        if not _EXIT_COMMANDS.isdisjoint(words):
+            return True
+        return any(
+            " ".join(words[:n]) in _EXIT_RESPONSES
+            for n in range(1, _EXIT_RESPONSE_MAX_WORDS + 1)
+        )
 
     def is_hard_exit(self, text: str) -> bool:
         """Exit detection for mid-question contexts (Tier 1 + 2 only).
@@ -424,23 +800,11 @@ class LLMService:
         cleaned = self.clean_input(text)
         if not cleaned:
             return False
-        for phrase in _FORCE_EXIT_PHRASES:
-            if phrase in cleaned:
-                return True
-        words = cleaned.split()
-        for cmd in _EXIT_COMMANDS:
-            if cmd in words:
-                return True
-        reset_phrases = [
-            "start over",
-            "wanna start over",
-            "want to start over",
-            "start from scratch",
-            "restart",
-            "reset everything",
-            "start from beginning",
-        ]
-        return any(phrase in cleaned for phrase in reset_phrases)
+        if _RE_FORCE_EXIT.search(cleaned):
+            return True
+        if not _EXIT_COMMANDS.isdisjoint(cleaned.split()):
+            return True
+        return bool(_RE_RESET.search(cleaned))
 
     def is_exit_llm(self, text):
         try:
@@ -490,20 +854,255 @@ safety, and monitors food recalls. Persists data across sessions using JSON file
 EXIT_MESSAGE = "Take care of those pets! See you next time."
 
 PETS_FILE = "petcare_pets.json"
-ACTIVITY_LOG_FILE = "petcare_activity_log.json"
+# Activity log is append-only JSON lines (one entry per line, oldest first).
+# The .json array file is the pre-append-log format, migrated on first load.
+ACTIVITY_LOG_FILE = "petcare_activity_log.log"
+LEGACY_ACTIVITY_LOG_FILE = "petcare_activity_log.json"
 REMINDERS_FILE = "petcare_reminders.json"
+REMINDER_SPOKEN_FORMAT = "%A at %I:%M %p"
+# Reminder edits within this many seconds are coalesced into one file write
+REMINDER_SAVE_DELAY = 0.2
+# Same coalescing window for pet profile edits
+PETS_SAVE_DELAY = 0.2
+# Species the openFDA and Serper News recall searches are run for
+RECALL_SPECIES = frozenset({"dog", "cat"})
+# Food recall results for the current UTC day; the feeds change at most daily
+RECALL_CACHE_FILE = "petcare_recall_cache.json"
+# Spoken recall summaries keyed by SHA-256 of the LLM prompt (LRU, bounded)
+RECALL_SUMMARY_CACHE_FILE = "petcare_recall_summaries.json"
+MAX_RECALL_SUMMARIES = 32
+# Open-Meteo geocoding results keyed by the normalized location (LRU, bounded)
+GEOCODE_CACHE_FILE = "petcare_geocode_cache.json"
+MAX_GEOCODE_ENTRIES = 32
+# In-memory API responses with per-endpoint lifetimes (seconds, LRU, bounded).
+# Geocoding has its own persistent cache above.
+WEATHER_CACHE_TTL = 30 * 60
+IP_LOCATION_CACHE_TTL = 24 * 60 * 60
+MAX_HTTP_CACHE_ENTRIES = 256
+# In-memory single-field extraction results keyed by (input, instruction)
+MAX_EXTRACT_CACHE = 128
 
 MAX_LOG_ENTRIES = 500
+# Most recent entries per pet handed to the lookup LLM
+LOOKUP_LOG_LIMIT = 50
+
+# Vets read out after a search. Pick scoring runs over at most this many
+# candidates, so plain set operations beat any vectorized matcher.
+MAX_VET_RESULTS = 3
+
+# Shared HTTP client settings: one keep-alive pool reused by every API call
+HTTP_TIMEOUT = 10
+HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5)
+# Transient failures get a couple of quick retries with full-jitter backoff.
+# Timeouts are not retried: a second 10 s wait would outlast the user.
+HTTP_RETRIES = 2
+HTTP_RETRY_BASE = 0.25
+HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Only the ip-api fields _detect_location_by_ip reads
+IP_API_FIELDS = "status,lat,lon,city,regionName,isp"
+# Response bodies and data files above this size are JSON-decoded off the event loop
+JSON_OFFLOAD_BYTES = 32 * 1024
+
+ACTIVITY_TYPES = frozenset(
+    {
+        "feeding",
+        "medication",
+        "walk",
+        "weight",
+        "vet_visit",
+        "grooming",
+        "other",
+    }
+)
 
-ACTIVITY_TYPES = {
-    "feeding",
-    "medication",
-    "walk",
-    "weight",
-    "vet_visit",
-    "grooming",
-    "other",
-}
+# Pet-care intents heard mid-onboarding that wait until setup finishes
+_ONBOARDING_DEFERRED_MODES = frozenset({"log", "greeting"})
+
+# Onboarding extracts only the name if the overview lacks all of these words:
+# without explicit animal words the model may infer a species from the
+# pet's name alone, causing follow-up questions to be skipped incorrectly.
+_SPECIES_KEYWORDS = frozenset(
+    {
+        # Species
+        "dog",
+        "cat",
+        "bird",
+        "rabbit",
+        "hamster",
+        "fish",
+        "turtle",
+        "snake",
+        "lizard",
+        "parrot",
+        "puppy",
+        "kitten",
+        "guinea",
+        "pig",
+        "ferret",
+        "horse",
+        "pony",
+        # Breed words that imply a species
+        "retriever",
+        "shepherd",
+        "bulldog",
+        "poodle",
+        "terrier",
+        "labrador",
+        "husky",
+        "beagle",
+        "chihuahua",
+        "dachshund",
+        "corgi",
+        "spaniel",
+        "collie",
+        "rottweiler",
+        "doberman",
+        "persian",
+        "siamese",
+        "tabby",
+        "bengal",
+        "sphynx",
+        "cockatiel",
+        "parakeet",
+        "canary",
+        "macaw",
+    }
+)
+
+# Pronouns, articles, species words, and short strings the model
+# may return from noisy input — treat these as missing pet names.
+_INVALID_NAMES = frozenset(
+    {
+        # Articles / determiners
+        "it",
+        "its",
+        "the",
+        "a",
+        "an",
+        # Pronouns / short function words
+        "do",
+        "to",
+        "no",
+        "yes",
+        "none",
+        "unknown",
+        "not",
+        "my",
+        "your",
+        "their",
+        "him",
+        "her",
+        "he",
+        "she",
+        "they",
+        # Generic responses and fillers
+        "yeah",
+        "yep",
+        "yup",
+        "nah",
+        "ok",
+        "okay",
+        "sure",
+        "uh",
+        # Common species — valid species but not valid names
+        "dog",
+        "cat",
+        "bird",
+        "rabbit",
+        "hamster",
+        "fish",
+        "turtle",
+        "snake",
+        "lizard",
+        "guinea",
+        "pig",
+        "parrot",
+        # Generic terms
+        "pet",
+        "animal",
+    }
+)
+
+_VALID_SPECIES = frozenset(
+    {
+        "dog",
+        "cat",
+        "bird",
+        "rabbit",
+        "hamster",
+        "fish",
+        "turtle",
+        "snake",
+        "lizard",
+        "parrot",
+        "puppy",
+        "kitten",
+        "guinea pig",
+        "ferret",
+        "horse",
+        "pony",
+        "gecko",
+        "frog",
+        "rat",
+        "mouse",
+        "chinchilla",
+        "hedgehog",
+        "hermit crab",
+        "cockatiel",
+        "parakeet",
+        "canary",
+        "macaw",
+        "iguana",
+    }
+)
+
+# Keyword sets for _handle_lookup, matched against the query's word tokens.
+# Inventory checks stay phrase-based since every entry spans several words.
+_WORD_RE = re.compile(r"[\w']+")
+
+_INVENTORY_PHRASES = (
+    "list registered pets",
+    "what pets",
+    "any pets",
+    "any animals",
+    "list pets",
+    "how many pets",
+)
+
+_PROFILE_KW = frozenset(
+    {
+        "info",
+        "information",
+        "profile",
+        "details",
+        "registered",
+        "register",
+        "about",
+        "stats",
+        "data",
+        "describe",
+        "record",
+        "records",
+    }
+)
+
+_WEIGHT_KW = frozenset(
+    {
+        "weight",
+        "weigh",
+        "weighs",
+        "weighed",
+        "gained",
+        "lost",
+        "pounds",
+        "lbs",
+    }
+)
+
+# Model error replies that must not be stored as a vet name
+_BAD_VET_NAME_RE = re.compile(
+    r"sorry|cannot|extract|provide|context|unknown|none"
+)
 
 # Serper API key placeholder — get a free key at serper.dev (2,500 free queries)
 SERPER_API_KEY = "your_serper_api_key_here"
@@ -514,9 +1113,11 @@ LOOKUP_SYSTEM_PROMPT = (
     "give a short, clear spoken answer. Include when it happened "
     "(e.g., 'this morning', '3 days ago', 'last Tuesday'). "
     "Keep it to 1-2 sentences. If no matching entries exist, say so. "
-    "Today's date is {today}."
+    "Today's date is given at the end of the user message."
 )
 
+# System prompts below are static strings so providers can cache them as a
+# prefix; per-call data (weather, logs, dates) goes in the user message.
 WEATHER_SYSTEM_PROMPT = (
     "You are a pet care assistant checking weather safety for a pet. "
     "Given the current weather data and the pet's info (species, breed), "
@@ -537,20 +1138,260 @@ WEIGHT_SUMMARY_PROMPT = (
     "You are a pet care assistant summarizing weight history. "
     "Given the weight log entries for a pet, give a short spoken summary "
     "of their current weight and any trend. Keep it to 1-2 sentences. "
-    "Today's date is {today}."
+    "Today's date is given at the end of the user message."
 )
 
+# text_to_text_response has no structured-output mode, so the schema is spelled
+# out here and the reply is validated by _coerce_pet_updates before applying.
+PET_UPDATE_SYSTEM_PROMPT = (
+    "You update a pet's stored profile from what the user said. "
+    "Return ONLY a JSON object containing the fields that should change, "
+    "with no markdown fences. Allowed fields and types:\n"
+    '- "breed": string\n'
+    '- "birthday": string, YYYY-MM-DD\n'
+    '- "weight_lbs": number\n'
+    '- "allergies": array of strings (the full new list)\n'
+    '- "medications": array of {"name": string, "frequency": string} '
+    "(the full new list)\n"
+    "Return {} if nothing should change."
+)
+
+# Onboarding answers are extracted with one structured call per utterance
+# instead of one call per field; each key mirrors a single-field extractor.
+OVERVIEW_EXTRACT_PROMPT = (
+    "Extract pet details from the user's description. "
+    "Return ONLY a JSON object with no markdown fences and these keys:\n"
+    '- "name": the pet\'s name\n'
+    '- "species": one word (dog, cat, bird, rabbit, hamster, etc.) ONLY if '
+    'explicitly mentioned, otherwise "unknown"\n'
+    '- "breed": the breed ONLY if explicitly mentioned; "mixed" if they say '
+    'mixed or don\'t know; otherwise "unknown"\n'
+    '- "birthday": YYYY-MM-DD; for an age like \'3 years old\', the approximate '
+    'birthday from today\'s date given below; otherwise ""\n'
+    '- "weight_lbs": weight as a number in pounds (convert kilos), or null\n'
+    "Do NOT guess species or breed from pet names or context."
+)
+
+HEALTH_EXTRACT_PROMPT = (
+    "Extract the pet's allergies and medications from the user's answer. "
+    "Return ONLY a JSON object with no markdown fences and these keys:\n"
+    '- "allergies": array of strings, e.g. ["chicken", "grain"]\n'
+    '- "medications": array of {"name": string, "frequency": string}, '
+    'e.g. [{"name": "Heartgard", "frequency": "monthly"}]\n'
+    "Use [] for either when none are mentioned."
+)
+
+RECALL_SYSTEM_PROMPT = (
+    "You are a pet care assistant reviewing recent pet food safety data. "
+    "Given FDA adverse event reports and/or news headlines and the user's pets, "
+    "summarize any recalls or safety concerns in 2-3 short spoken sentences. "
+    "Mention the brands involved if known. Don't be alarmist. "
+    "If nothing seems serious or relevant, say so clearly."
+)
+
+
+_WEEKDAY_MAP = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
+
+# All reminder time patterns as one alternation, in priority order. Each
+# branch starts with a lazy "skip anything" prefix and is anchored with
+# match(), so the engine exhausts a branch before trying the next one —
+# preserving the old "first pattern that matches anywhere wins" order.
+# The outer named group of each branch tells the parser which one hit.
+_DAY_PATTERN = "|".join(_WEEKDAY_MAP)
+_HM = r"(?P<{0}_h>\d{{1,2}})(?::(?P<{0}_m>\d{{2}}))?\s*(?P<{0}_ap>am|pm)?"
+# Whole-utterance phrases answered without the regex, in _reminder_time_spec
+# form. Bare "tomorrow" uses the same 9 AM default as a bare weekday.
+_FIXED_REMINDER_PHRASES = {
+    "in an hour": ("delta", timedelta(hours=1)),
+    "in half an hour": ("delta", timedelta(minutes=30)),
+    "tonight": ("tonight", 20, 0),
+    "tomorrow": ("tomorrow", 9, 0),
+}
+# "tonight" said after 8 PM means later this evening, not tomorrow night
+TONIGHT_LATE_DELAY = timedelta(hours=1)
+_RE_REMINDER = re.compile(
+    r"[\s\S]*?(?P<rel_min>in (?P<min_n>\d+) minute)"
+    r"|[\s\S]*?(?P<rel_hr>in (?P<hr_n>\d+) hour)"
+    r"|[\s\S]*?(?P<tomorrow>tomorrow.*?" + _HM.format("tom") + ")"
+    r"|[\s\S]*?(?P<qday>(?:next|this|on)\s+(?P<qday_name>" + _DAY_PATTERN + ")"
+    r"(?:.*?" + _HM.format("qday") + ")?)"
+    r"|[\s\S]*?(?P<day>(?P<day_name>" + _DAY_PATTERN + ")"
+    r"(?:.*?" + _HM.format("day") + ")?)"
+    r"|[\s\S]*?(?P<at>at " + _HM.format("at") + ")"
+)
+# Words too common in vet names to tell search results apart
+_VET_GENERIC_WORDS = frozenset(
+    {
+        "vet",
+        "veterinary",
+        "animal",
+        "hospital",
+        "clinic",
+        "pet",
+        "the",
+        "and",
+        "of",
+        "a",
+    }
+)
+# Words too common in pet food brand names to tie a report to a logged food
+_BRAND_GENERIC_WORDS = frozenset(
+    {
+        "pet",
+        "pets",
+        "dog",
+        "dogs",
+        "cat",
+        "cats",
+        "food",
+        "foods",
+        "brand",
+        "brands",
+        "company",
+        "inc",
+        "llc",
+        "the",
+        "and",
+    }
+)
+# Deletion table for stripping whitespace with str.translate (no regex engine)
+_WS_DELETE = str.maketrans("", "", " \t\n\r\f\v\xa0")
+
+
+async def _loads(text):
+    """json.loads, in a worker thread when the text is large.
+
+    Keeps multi-millisecond parses of big payloads and data files from
+    stalling speech and sibling requests on the event loop.
+    """
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+    # except clauses hold either way.
+    loads = json.loads if orjson is None else orjson.loads
+    if len(text) > JSON_OFFLOAD_BYTES:
+        return await asyncio.to_thread(loads, text)
+    return loads(text)
+
+
+async def _decode_json(resp: httpx.Response):
+    """Decode a JSON response body, off the event loop when it is large."""
+    return await _loads(resp.content)
 
-def _strip_json_fences(text: str) -> str:
-    """Strip markdown code fences from LLM output (e.g. ```json ... ```)."""
-    text = text.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        text = "\n".join(lines)
-    return text.strip()
+
+def _reminder_due_ts(reminder: dict) -> float:
+    """Sort key for reminders; entries without a due time sort last."""
+    return reminder.get("due_ts", float("inf"))
+
+
+def _activity_deque(entries=()) -> deque:
+    """Build an in-memory activity log (newest first, MAX_LOG_ENTRIES cap)."""
+    return deque(entries, maxlen=MAX_LOG_ENTRIES)
+
+
+_PROMPT_LOG_FIELDS = ("type", "details", "timestamp", "value")
+
+
+def _prompt_log_entries(entries, with_pet_name=True) -> list:
+    """Project log entries onto the fields an LLM prompt needs.
+
+    Drops the entry and pet ids, and the pet name when every entry belongs
+    to the same (already named) pet.
+    """
+    fields = _PROMPT_LOG_FIELDS
+    if with_pet_name:
+        fields = ("pet_name",) + fields
+    return [{k: e[k] for k in fields if k in e} for e in entries]
+
+
+def _compact_json(data) -> str:
+    """Serialize data for an LLM prompt or data file without whitespace padding.
+
+    json.dumps with indent falls back to the pure-Python encoder; compact
+    separators keep the C encoder and also cut prompt tokens and file size.
+    orjson, when installed, emits the same compact form faster still.
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _coerce_pet_updates(raw) -> dict:
+    """Keep only known pet fields with the expected types from an LLM diff."""
+    if not isinstance(raw, dict):
+        return {}
+    updates = {}
+    for field in ("breed", "birthday"):
+        value = raw.get(field)
+        if isinstance(value, str) and value.strip():
+            updates[field] = value.strip()
+    if "weight_lbs" in raw:
+        try:
+            updates["weight_lbs"] = float(raw["weight_lbs"])
+        except (TypeError, ValueError):
+            pass
+    allergies = raw.get("allergies")
+    if isinstance(allergies, list):
+        updates["allergies"] = [str(a) for a in allergies if a]
+    medications = raw.get("medications")
+    if isinstance(medications, list):
+        updates["medications"] = [
+            m for m in medications if isinstance(m, (dict, str)) and m
+        ]
+    return updates
+
+
+_ORDINAL_WORDS = {
+    "first": 0,
+    "1st": 0,
+    "second": 1,
+    "2nd": 1,
+    "third": 2,
+    "3rd": 2,
+    "last": -1,
+}
+_RE_PICK_NUMBER = re.compile(r"\b(?:number\s+)?([1-9]|one|two|three)\b")
+_NUMBER_WORDS = {"one": 1, "two": 2, "three": 3}
+# Minimum difflib ratio for a fuzzy title match to be trusted without the LLM
+_PICK_SIMILARITY_THRESHOLD = 0.6
+
+
+def _local_pick_vet(pick_lower: str, candidates: list) -> dict | None:
+    """Resolve a vet pick without the LLM when the answer is unambiguous.
+
+    Handles ordinal picks ("the second one", "number 3", "last") and titles
+    that are close in spelling to what was heard (STT slips). Returns None
+    when neither is confident, so the caller can fall back to the LLM.
+    """
+    if not candidates:
+        return None
+    words = pick_lower.split()
+    for w in words:
+        idx = _ORDINAL_WORDS.get(w.strip(".,!?"))
+        if idx is not None:
+            return candidates[idx] if idx < len(candidates) else None
+    # Bare "one" only counts as a number when it is the whole answer
+    # ("the second one" was handled above).
+    m = _RE_PICK_NUMBER.search(pick_lower)
+    if m and (m.group(1) != "one" or len(words) <= 2):
+        n = _NUMBER_WORDS.get(m.group(1)) or int(m.group(1))
+        if 1 <= n <= len(candidates):
+            return candidates[n - 1]
+
+    pick_compact = pick_lower.translate(_WS_DELETE)
+    best, best_ratio = None, 0.0
+    for place in candidates:
+        title_compact = place.get("title", "").lower().translate(_WS_DELETE)
+        ratio = difflib.SequenceMatcher(None, pick_compact, title_compact).ratio()
+        if ratio > best_ratio:
+            best, best_ratio = place, ratio
+    return best if best_ratio >= _PICK_SIMILARITY_THRESHOLD else None
 
 
 def _fmt_phone_for_speech(phone: str) -> str:
@@ -559,37 +1400,23 @@ def _fmt_phone_for_speech(phone: str) -> str:
     Handles multiple formats:
     - 10-digit US: (512) 555-1234 → "5, 1, 2, 5, 5, 5, 1, 2, 3, 4"
     - 11-digit US with country code: 1-512-555-1234 → "1, 5, 1, 2, 5, 5, 5, ..."
-    - International (7-15 digits): grouped by 3s for readability
-    - Invalid lengths (<7 or >15): all digits or error message
+    - International (7-15 digits): same digit-by-digit reading
+    - Invalid lengths (<7 or >15): error message
     """
     if not phone:
         return "no number provided"
 
-    digits = re.sub(r"\D", "", phone)
+    digits = _RE_NON_DIGIT.sub("", phone)
 
     if not digits:
         return "no number provided"
-
-    if len(digits) == 10:
-        return (
-            f"{', '.join(digits[:3])}, "
-            f"{', '.join(digits[3:6])}, "
-            f"{', '.join(digits[6:])}"
-        )
-    elif len(digits) == 11 and digits[0] == "1":
-        return (
-            f"1, "
-            f"{', '.join(digits[1:4])}, "
-            f"{', '.join(digits[4:7])}, "
-            f"{', '.join(digits[7:])}"
-        )
-    elif 7 <= len(digits) <= 15:
-        groups = [digits[i: i + 3] for i in range(0, len(digits), 3)]
-        return ", ".join(", ".join(group) for group in groups)
-    elif len(digits) < 7:
+    if len(digits) < 7:
         return "incomplete phone number"
-    else:
+    if len(digits) > 15:
         return "phone number too long, please check"
+    # Every accepted length is read one digit at a time; the old per-format
+    # grouping produced the same string with extra slicing and joins.
+    return ", ".join(digits)
 
 
 class PetCareAssistantCapability(MatchingCapability):
@@ -600,17 +1427,45 @@ class PetCareAssistantCapability(MatchingCapability):
     worker: AgentWorker = None
     capability_worker: CapabilityWorker = None
     pet_data: dict = None
-    activity_log: list = None
+    # Newest first, bounded to MAX_LOG_ENTRIES; appendleft evicts the oldest
+    activity_log: deque = None
     _geocode_cache: dict = None
+    # pet id -> pet dict (same objects as in pet_data["pets"])
+    _pet_index: dict = None
+    # lowercased pet name -> pet dict, for name resolution
+    _pets_by_name: dict = None
+    # pet id -> deque of that pet's newest LOOKUP_LOG_LIMIT log entries,
+    # newest first (same objects as in activity_log)
+    _log_by_pet: dict = None
+    # Species of the user's pets that the FDA/news recall searches support
+    _recall_species: frozenset = frozenset()
+    _recall_summary_cache: OrderedDict = None
+    # (kind, *params) -> (monotonic expiry, response); see _ttl_cache_get
+    _http_cache: OrderedDict = None
+    # Reminder saves are debounced; see _schedule_reminders_save
+    _reminders_dirty: bool = False
+    _reminders_flush_pending: bool = False
+    _reminders_save_lock: asyncio.Lock = None
+    # Pet profile saves are debounced the same way; see _schedule_pets_save
+    _pets_dirty: bool = False
+    _pets_flush_pending: bool = False
+    _pets_save_lock: asyncio.Lock = None
+    # Geocode cache loads and saves run one at a time, and concurrent lookups
+    # of one city share a single request; see _geocode_location
+    _geocode_lock: asyncio.Lock = None
+    _geocode_inflight: dict = None
 
     # Services initialized in run()
     pet_data_service: "PetDataService" = None
     activity_log_service: "ActivityLogService" = None
     external_api_service: "ExternalAPIService" = None
     llm_service: "LLMService" = None
+    _http: httpx.AsyncClient = None
     reminders: list = None
     # Stash for a command embedded in a "no more pets" response during onboarding
     _pending_intent_text: str = None
+    # Lines currently in ACTIVITY_LOG_FILE, used to decide when to compact it
+    _activity_log_lines: int = 0
 
     def call(self, worker: AgentWorker):
         self.worker = worker
@@ -625,21 +1480,12 @@ class PetCareAssistantCapability(MatchingCapability):
         """
         if not text:
             return False
-        cleaned = re.sub(r"[^\w\s']", "", text.lower().strip())
+        cleaned = _strip_punct(text.lower().strip())
         # Single-word abort commands
-        if any(w in cleaned.split() for w in ["stop", "quit", "exit", "cancel"]):
+        if not _EXIT_COMMANDS.isdisjoint(cleaned.split()):
             return True
         # Reset/restart phrases
-        reset_phrases = [
-            "start over",
-            "wanna start over",
-            "want to start over",
-            "start from scratch",
-            "restart",
-            "reset everything",
-            "start from beginning",
-        ]
-        return any(phrase in cleaned for phrase in reset_phrases)
+        return bool(_RE_RESET.search(cleaned))
 
     # === Main flow ===
 
@@ -650,20 +1496,35 @@ class PetCareAssistantCapability(MatchingCapability):
             self.pet_data_service = PetDataService(self.capability_worker, self.worker)
             self.activity_log_service = ActivityLogService(self.worker, MAX_LOG_ENTRIES)
             self.external_api_service = ExternalAPIService(self.worker, SERPER_API_KEY)
+            self._http = httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
 
             self.pet_data = await self.pet_data_service.load_json(PETS_FILE, default={})
+            self._index_pets()
+            self._pets_save_lock = asyncio.Lock()
             self.llm_service = LLMService(
                 self.capability_worker, self.worker, self.pet_data
             )
-            self.activity_log = await self.pet_data_service.load_json(
-                ACTIVITY_LOG_FILE, default=[]
-            )
+            self.activity_log = await self._load_activity_log()
+            self._index_activity_log()
             self.reminders = await self.pet_data_service.load_json(
                 REMINDERS_FILE, default=[]
             )
+            self._backfill_reminder_timestamps()
+            self._reminders_save_lock = asyncio.Lock()
 
-            self._geocode_cache = {}
+            self._geocode_cache = None
+            self._geocode_lock = asyncio.Lock()
+            self._geocode_inflight = {}
+            self._http_cache = OrderedDict()
             self._corrected_name = None
+            if (
+                self.pet_data.get("pets")
+                and self.pet_data.get("user_location")
+                and not self.pet_data.get("user_lat")
+            ):
+                # Geocode the saved city while the user is still talking, so
+                # the first weather or vet request doesn't wait on the lookup.
+                self.worker.session_tasks.create(self._prefetch_location())
             await self._check_due_reminders()
 
             trigger = self.llm_service.get_trigger_context()
@@ -736,8 +1597,9 @@ class PetCareAssistantCapability(MatchingCapability):
                         greeting + " Want me to read your reminders?"
                     )
                     resp = await self.capability_worker.user_response()
+                    resp_lower = resp.lower() if resp else ""
                     if resp and any(
-                        w in resp.lower()
+                        w in resp_lower
                         for w in ["yes", "yeah", "yep", "sure", "read", "go", "yup"]
                     ):
                         await self._handle_reminder({"action": "list"})
@@ -781,14 +1643,8 @@ class PetCareAssistantCapability(MatchingCapability):
 
                 # Reset/restart phrases map to edit_pet+reset_all and must not
                 # be classified as exits; guard both code paths against that.
-                _reset_phrases = [
-                    "start over",
-                    "start from scratch",
-                    "restart",
-                    "reset everything",
-                    "start from beginning",
-                ]
-                _is_reset = any(p in cleaned for p in _reset_phrases)
+                _is_reset = bool(_RE_RESET.search(cleaned))
+                _is_reminder = bool(_RE_REMINDER_WORD.search(cleaned))
 
                 # Long inputs bypass keyword checks: "no <follow-up>" would
                 # false-positive as an exit via Tier-3 prefix match, so send
@@ -800,7 +1656,7 @@ class PetCareAssistantCapability(MatchingCapability):
                         await self.capability_worker.speak(EXIT_MESSAGE)
                         break
                 else:
-                    if not _is_reset:
+                    if not _is_reset and not _is_reminder:
                         if self.llm_service.is_exit(user_input):
                             await self.capability_worker.speak(EXIT_MESSAGE)
                             break
@@ -843,8 +1699,20 @@ class PetCareAssistantCapability(MatchingCapability):
                 "Something went wrong. Closing Pet Care."
             )
         finally:
-            self.worker.editor_logging_handler.info("[PetCare] Ability ended")
-            self.capability_worker.resume_normal_flow()
+            # Teardown must never keep resume_normal_flow() from running, or
+            # the agent stays stuck in the ability. Save failures are already
+            # logged by save_json.
+            try:
+                await asyncio.gather(
+                    self._flush_reminders(),
+                    self._flush_pets(),
+                    return_exceptions=True,
+                )
+                if self._http is not None:
+                    await self._http.aclose()
+            finally:
+                self.worker.editor_logging_handler.info("[PetCare] Ability ended")
+                self.capability_worker.resume_normal_flow()
 
     # === Intent router ===
 
@@ -902,10 +1770,8 @@ class PetCareAssistantCapability(MatchingCapability):
                 await self.capability_worker.speak("No problem. Come back anytime!")
                 return
 
-            if "pets" not in self.pet_data:
-                self.pet_data["pets"] = []
-            self.pet_data["pets"].append(pet)
-            await self._save_json(PETS_FILE, self.pet_data)
+            self._add_pet(pet)
+            self._schedule_pets_save()
 
             await self.capability_worker.speak(
                 f"Awesome, {pet['name']} is all set! "
@@ -931,10 +1797,7 @@ class PetCareAssistantCapability(MatchingCapability):
                 # User said no (possibly with an embedded follow-up command,
                 # e.g. "No, is it safe to walk Luna?"). Strip leading negation
                 # and stash any remaining content so the main loop handles it.
-                _no_strip = re.compile(
-                    r"^(?:no[,.]?|nope[,.]?|nah[,.]?)\s*", re.IGNORECASE
-                )
-                remainder = _no_strip.sub("", response).strip()
+                remainder = _RE_LEADING_NO.sub("", response).strip()
                 if remainder and len(remainder.split()) >= 3:
                     self._pending_intent_text = remainder
                 break
@@ -1109,8 +1972,7 @@ class PetCareAssistantCapability(MatchingCapability):
                 return True
 
             # Pet-care-related but not actionable inline (log, greeting)
-            _PET_CARE_MODES = {"log", "greeting"}
-            if mode in _PET_CARE_MODES:
+            if mode in _ONBOARDING_DEFERRED_MODES:
                 await self.capability_worker.speak(
                     "I can help with that once we finish setting up! "
                     "Let's continue for now."
@@ -1177,66 +2039,21 @@ class PetCareAssistantCapability(MatchingCapability):
         if not overview or self._is_hard_exit(overview):
             return None
 
-        # Skip parallel extraction if the overview lacks species/breed keywords:
-        # without explicit animal words the model may infer a species from the
-        # pet's name alone, causing follow-up questions to be skipped incorrectly.
-        _SPECIES_KEYWORDS = {
-            # Species
-            "dog",
-            "cat",
-            "bird",
-            "rabbit",
-            "hamster",
-            "fish",
-            "turtle",
-            "snake",
-            "lizard",
-            "parrot",
-            "puppy",
-            "kitten",
-            "guinea",
-            "pig",
-            "ferret",
-            "horse",
-            "pony",
-            # Breed words that imply a species
-            "retriever",
-            "shepherd",
-            "bulldog",
-            "poodle",
-            "terrier",
-            "labrador",
-            "husky",
-            "beagle",
-            "chihuahua",
-            "dachshund",
-            "corgi",
-            "spaniel",
-            "collie",
-            "rottweiler",
-            "doberman",
-            "persian",
-            "siamese",
-            "tabby",
-            "bengal",
-            "sphynx",
-            "cockatiel",
-            "parakeet",
-            "canary",
-            "macaw",
-        }
-        overview_words = set(overview.lower().split())
-        has_species_info = bool(overview_words & _SPECIES_KEYWORDS)
+        has_species_info = not _SPECIES_KEYWORDS.isdisjoint(overview.lower().split())
 
         if has_species_info:
-            # Overview mentions an animal type — extract everything in parallel
-            name, species, breed, birthday, weight_str = await asyncio.gather(
-                self.llm_service.extract_pet_name_async(overview),
-                self.llm_service.extract_species_async(overview),
-                self.llm_service.extract_breed_async(overview),
-                self.llm_service.extract_birthday_async(overview),
-                self.llm_service.extract_weight_async(overview),
-            )
+            # Overview mentions an animal type — extract everything in one
+            # structured call, falling back to per-field calls in parallel.
+            extracted = await self.llm_service.extract_overview_async(overview)
+            if extracted is None:
+                extracted = await asyncio.gather(
+                    self.llm_service.extract_pet_name_async(overview),
+                    self.llm_service.extract_species_async(overview),
+                    self.llm_service.extract_breed_async(overview),
+                    self.llm_service.extract_birthday_async(overview),
+                    self.llm_service.extract_weight_async(overview),
+                )
+            name, species, breed, birthday, weight_str = extracted
             # Short overviews cannot reliably contain all fields.
             # Only trust breed/birthday/weight from longer, detailed inputs.
             if len(overview.split()) <= 8:
@@ -1247,89 +2064,6 @@ class PetCareAssistantCapability(MatchingCapability):
             name = await self.llm_service.extract_pet_name_async(overview)
             species, breed, birthday, weight_str = "unknown", "unknown", "", ""
 
-        # Pronouns, articles, species words, and short strings the model
-        # may return from noisy input — treat these as missing pet names.
-        _INVALID_NAMES = {
-            # Articles / determiners
-            "it",
-            "its",
-            "the",
-            "a",
-            "an",
-            # Pronouns / short function words
-            "do",
-            "to",
-            "no",
-            "yes",
-            "none",
-            "unknown",
-            "not",
-            "my",
-            "your",
-            "their",
-            "him",
-            "her",
-            "he",
-            "she",
-            "they",
-            # Generic responses and fillers
-            "yeah",
-            "yep",
-            "yup",
-            "nah",
-            "ok",
-            "okay",
-            "sure",
-            "uh",
-            # Common species — valid species but not valid names
-            "dog",
-            "cat",
-            "bird",
-            "rabbit",
-            "hamster",
-            "fish",
-            "turtle",
-            "snake",
-            "lizard",
-            "guinea",
-            "pig",
-            "parrot",
-            # Generic terms
-            "pet",
-            "animal",
-        }
-
-        _VALID_SPECIES = {
-            "dog",
-            "cat",
-            "bird",
-            "rabbit",
-            "hamster",
-            "fish",
-            "turtle",
-            "snake",
-            "lizard",
-            "parrot",
-            "puppy",
-            "kitten",
-            "guinea pig",
-            "ferret",
-            "horse",
-            "pony",
-            "gecko",
-            "frog",
-            "rat",
-            "mouse",
-            "chinchilla",
-            "hedgehog",
-            "hermit crab",
-            "cockatiel",
-            "parakeet",
-            "canary",
-            "macaw",
-            "iguana",
-        }
-
         def _missing(v):
             return not v or v.lower().strip() in ("unknown", "none", "")
 
@@ -1388,9 +2122,13 @@ class PetCareAssistantCapability(MatchingCapability):
                 if resp2 is None:
                     return None
                 if resp2:
-                    species = await self.llm_service.extract_species_async(resp2)
                     if _missing(breed):
-                        breed = await self.llm_service.extract_breed_async(resp2)
+                        species, breed = await asyncio.gather(
+                            self.llm_service.extract_species_async(resp2),
+                            self.llm_service.extract_breed_async(resp2),
+                        )
+                    else:
+                        species = await self.llm_service.extract_species_async(resp2)
 
         # ── Step 1a: breed (if still unknown after species step) ─────────────
         if _missing(breed):
@@ -1403,8 +2141,9 @@ class PetCareAssistantCapability(MatchingCapability):
                 self._corrected_name = None
             if breed_input is None:
                 return None
+            breed_lower = breed_input.lower() if breed_input else ""
             if breed_input and not any(
-                w in breed_input.lower() for w in ["skip", "don't know", "no idea"]
+                w in breed_lower for w in ["skip", "don't know", "no idea"]
             ):
                 breed = await self.llm_service.extract_breed_async(breed_input)
 
@@ -1421,7 +2160,9 @@ class PetCareAssistantCapability(MatchingCapability):
             if age_input is None:
                 return None
             if age_input and "skip" not in age_input.lower():
-                birthday = await self.llm_service.extract_birthday_async(age_input)
+                birthday = _parse_birthday(
+                    age_input
+                ) or await self.llm_service.extract_birthday_async(age_input)
 
         # ── Step 1c: weight (if not in overview) ─────────────────────────────
         if _missing(weight_str):
@@ -1435,7 +2176,9 @@ class PetCareAssistantCapability(MatchingCapability):
             if weight_input is None:
                 return None
             if weight_input and "skip" not in weight_input.lower():
-                weight_str = await self.llm_service.extract_weight_async(weight_input)
+                weight_str = _parse_weight_lbs(
+                    weight_input
+                ) or await self.llm_service.extract_weight_async(weight_input)
 
         # ── Step 2: health (allergies + medications in one question) ─────────
         health_input = await self._ask_onboarding_step(
@@ -1448,8 +2191,13 @@ class PetCareAssistantCapability(MatchingCapability):
             self._corrected_name = None
         if health_input is None:
             return None
+        health = None
+        if health_input:
+            health = await self.llm_service.extract_health_async(health_input)
         if not health_input:
             allergies, medications = [], []
+        elif health is not None:
+            allergies, medications = health
         else:
             allergies_str, meds_str = await asyncio.gather(
                 self.llm_service.extract_allergies_async(health_input),
@@ -1478,8 +2226,9 @@ class PetCareAssistantCapability(MatchingCapability):
                 return None  # User wants to abort/restart
 
             def _is_skip(v):
+                v_lower = v.lower()
                 return any(
-                    w in v.lower() for w in ["no", "nope", "skip", "don't", "none"]
+                    w in v_lower for w in ["no", "nope", "skip", "don't", "none"]
                 )
 
             # Affirmative without a name ("yes", "yeah", "sure") → ask for the name
@@ -1508,18 +2257,7 @@ class PetCareAssistantCapability(MatchingCapability):
                 _bad_vet = (
                     not vet_name
                     or len(vet_name) > 60
-                    or any(
-                        w in vet_name.lower()
-                        for w in [
-                            "sorry",
-                            "cannot",
-                            "extract",
-                            "provide",
-                            "context",
-                            "unknown",
-                            "none",
-                        ]
-                    )
+                    or _BAD_VET_NAME_RE.search(vet_name.lower()) is not None
                 )
                 if _bad_vet:
                     vet_name = vet_input.strip()[:60]  # Use raw input as fallback
@@ -1530,12 +2268,15 @@ class PetCareAssistantCapability(MatchingCapability):
                 if phone_input is None:
                     return None  # User wants to abort/restart
                 if phone_input and "skip" not in phone_input.lower():
-                    vet_phone = await self.llm_service.extract_phone_number_async(
+                    vet_phone = _parse_phone_digits(
                         phone_input
-                    )
+                    ) or await self.llm_service.extract_phone_number_async(phone_input)
                     # Only save if it looks like a real number (≥ 7 digits)
-                    if len(re.sub(r"\D", "", vet_phone)) >= 7:
+                    if len(_RE_NON_DIGIT.sub("", vet_phone)) >= 7:
                         self.pet_data["vet_phone"] = vet_phone
+                        self.pet_data["vet_phone_spoken"] = _fmt_phone_for_speech(
+                            vet_phone
+                        )
                     else:
                         await self.capability_worker.speak(
                             "That doesn't look like a complete number. "
@@ -1564,7 +2305,7 @@ class PetCareAssistantCapability(MatchingCapability):
             weight_lbs = 0
 
         return {
-            "id": f"pet_{uuid.uuid4().hex[:6]}",
+            "id": f"pet_{secrets.token_hex(3)}",
             "name": name,
             "species": (species or "unknown").lower(),
             "breed": breed or "unknown",
@@ -1585,32 +2326,59 @@ class PetCareAssistantCapability(MatchingCapability):
         activity_type = intent.get("activity_type", "other")
         details = intent.get("details", "")
         value = intent.get("value")
+        now = datetime.now()
 
         entry = {
-            "id": f"log_{uuid.uuid4().hex[:6]}",
+            "id": f"log_{secrets.token_hex(3)}",
             "pet_id": pet["id"],
             "pet_name": pet["name"],
             "type": activity_type,
             "details": details,
-            "timestamp": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            "timestamp": now.isoformat(timespec="seconds"),
         }
 
-        if activity_type == "weight" and value is not None:
+        is_weight = activity_type == "weight" and value is not None
+        if is_weight:
             entry["value"] = value
-            for p in self.pet_data.get("pets", []):
-                if p["id"] == pet["id"]:
-                    p["weight_lbs"] = value
-                    break
-            await self._save_json(PETS_FILE, self.pet_data)
 
-        self.activity_log.insert(0, entry)
+        if len(self.activity_log) == self.activity_log.maxlen:
+            # The entry about to be evicted leaves the per-pet index too; being
+            # the oldest overall, it is the last in its pet's deque if there.
+            dropped = self.activity_log[-1]
+            pet_logs = self._log_by_pet.get(dropped.get("pet_id"))
+            if pet_logs and pet_logs[-1] is dropped:
+                pet_logs.pop()
+        self.activity_log.appendleft(entry)
+        pet_logs = self._log_by_pet.setdefault(
+            pet["id"], deque(maxlen=LOOKUP_LOG_LIMIT)
+        )
+        pet_logs.appendleft(entry)
 
-        if len(self.activity_log) > MAX_LOG_ENTRIES:
-            self.activity_log = self.activity_log[:MAX_LOG_ENTRIES]
+        # The write finishes before anything is confirmed, so a failed write
+        # is never reported as logged. The in-memory log is updated first
+        # because compaction rewrites the file from it.
+        try:
+            await self._append_activity(entry)
+        except Exception as e:
+            self.worker.editor_logging_handler.error(
+                f"[PetCare] Failed to log activity: {e}"
+            )
+            if self.activity_log and self.activity_log[0] is entry:
+                self.activity_log.popleft()
+            if pet_logs and pet_logs[0] is entry:
+                pet_logs.popleft()
+            await self.capability_worker.speak(
+                f"Sorry, I couldn't save that log for {pet['name']}. Please try again."
+            )
+            return
 
-        await self._save_json(ACTIVITY_LOG_FILE, self.activity_log)
+        if is_weight:
+            indexed = self._pet_index.get(pet["id"])
+            if indexed is not None:
+                indexed["weight_lbs"] = value
+            self._schedule_pets_save()
 
-        time_str = datetime.now().strftime("%I:%M %p").lstrip("0")
+        time_str = now.strftime("%I:%M %p").lstrip("0")
         await self.capability_worker.speak(
             f"Got it. Logged {pet['name']}'s {activity_type} at {time_str}."
         )
@@ -1620,18 +2388,11 @@ class PetCareAssistantCapability(MatchingCapability):
     async def _handle_lookup(self, intent: dict):
         """Answer a question about pet activity history."""
         query = intent.get("query", "")
+        q_lower = query.lower()
+        q_words = set(_WORD_RE.findall(q_lower))
 
         # Handle pet inventory queries directly from pet_data
-        if "list registered pets" in query.lower() or any(
-            w in query.lower()
-            for w in [
-                "what pets",
-                "any pets",
-                "any animals",
-                "list pets",
-                "how many pets",
-            ]
-        ):
+        if any(p in q_lower for p in _INVENTORY_PHRASES):
             pets = self.pet_data.get("pets", [])
             if not pets:
                 await self.capability_worker.speak(
@@ -1654,20 +2415,7 @@ class PetCareAssistantCapability(MatchingCapability):
         pet = await self._resolve_pet_async(intent.get("pet_name"))
 
         # Handle pet profile queries — return registered info, not activity log
-        _profile_keywords = {
-            "info",
-            "information",
-            "profile",
-            "details",
-            "registered",
-            "register",
-            "about",
-            "stats",
-            "data",
-            "describe",
-            "record",
-        }
-        if pet and any(w in query.lower() for w in _profile_keywords):
+        if pet and q_words & _PROFILE_KW:
             parts = [
                 f"{pet['name']} is a {pet.get('breed', 'unknown breed')} "
                 f"{pet.get('species', 'unknown')}"
@@ -1696,35 +2444,35 @@ class PetCareAssistantCapability(MatchingCapability):
             return
 
         if pet:
-            relevant_logs = [
-                e for e in self.activity_log if e.get("pet_id") == pet["id"]
-            ][:50]
+            relevant_logs = list(self._log_by_pet.get(pet["id"], ()))
         else:
-            relevant_logs = self.activity_log[:50]
+            relevant_logs = list(itertools.islice(self.activity_log, LOOKUP_LOG_LIMIT))
 
-        if any(
-            w in query.lower()
-            for w in ["weight", "weigh", "gained", "lost", "pounds", "lbs"]
-        ):
+        if q_words & _WEIGHT_KW:
             await self._handle_weight_lookup(pet, relevant_logs)
             return
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        system = LOOKUP_SYSTEM_PROMPT.format(today=today)
+        today = datetime.now().date().isoformat()
 
         log_text = (
-            json.dumps(relevant_logs, indent=2)
+            _compact_json(_prompt_log_entries(relevant_logs, with_pet_name=not pet))
             if relevant_logs
             else "No entries found."
         )
+        log_label = "Activity log entries"
+        if pet:
+            log_label += f" for {pet['name']}"
 
-        prompt = f"User's question: {query}\n\nActivity log entries:\n{log_text}"
+        prompt = (
+            f"User's question: {query}\n\n{log_label}:\n{log_text}\n\n"
+            f"Today's date: {today}"
+        )
 
         try:
             response = await asyncio.to_thread(
                 self.capability_worker.text_to_text_response,
                 prompt,
-                system_prompt=system,
+                system_prompt=LOOKUP_SYSTEM_PROMPT,
             )
             await self.capability_worker.speak(response)
         except Exception as e:
@@ -1750,20 +2498,21 @@ class PetCareAssistantCapability(MatchingCapability):
             )
             return
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        system = WEIGHT_SUMMARY_PROMPT.format(today=today)
+        today = datetime.now().date().isoformat()
 
+        history = _compact_json(_prompt_log_entries(weight_entries, with_pet_name=False))
         prompt = (
             f"Pet: {pet['name']} ({pet['species']}, {pet['breed']})\n"
             f"Current recorded weight: {pet.get('weight_lbs', 'unknown')} lbs\n\n"
-            f"Weight history entries:\n{json.dumps(weight_entries, indent=2)}"
+            f"Weight history entries:\n{history}\n\n"
+            f"Today's date: {today}"
         )
 
         try:
             response = await asyncio.to_thread(
                 self.capability_worker.text_to_text_response,
                 prompt,
-                system_prompt=system,
+                system_prompt=WEIGHT_SUMMARY_PROMPT,
             )
             await self.capability_worker.speak(response)
         except Exception as e:
@@ -1782,10 +2531,12 @@ class PetCareAssistantCapability(MatchingCapability):
         saved_phone = self.pet_data.get("vet_phone", "")
 
         if saved_vet:
+            # Spoken form is cached alongside the raw number; older data files
+            # predate the cache, so fill it in lazily on first use.
+            if saved_phone and not self.pet_data.get("vet_phone_spoken"):
+                self.pet_data["vet_phone_spoken"] = _fmt_phone_for_speech(saved_phone)
             phone_spoken = (
-                _fmt_phone_for_speech(saved_phone)
-                if saved_phone
-                else "no number on file"
+                self.pet_data.get("vet_phone_spoken") or "no number on file"
             )
             await self.capability_worker.speak(
                 f"Your regular vet is {saved_vet} at {phone_spoken}."
@@ -1811,34 +2562,39 @@ class PetCareAssistantCapability(MatchingCapability):
         if not lat or not lon:
             saved_location = self.pet_data.get("user_location", "")
             if saved_location:
+                # Geocode the saved city while the question is asked, but only
+                # wait on it if the user actually picks it.
+                saved_lookup = self._start_lookup(
+                    self._geocode_location(saved_location)
+                )
                 await self.capability_worker.speak(
                     f"I'll detect your location from your current IP address. "
                     f"Or, if you'd like to search near your registered location, {saved_location}, say that now."
                 )
                 loc_response = await self.capability_worker.user_response()
                 if loc_response and not self.llm_service.is_exit(loc_response):
+                    loc_lower = loc_response.lower()
+                    saved_city = saved_location.split(",")[0].strip().lower()
                     use_saved = any(
-                        word in loc_response.lower()
-                        for word in [
-                            "registered",
-                            "saved",
-                            "that",
-                            saved_location.lower().split(",")[0].lower(),
-                        ]
+                        word in loc_lower
+                        for word in ["registered", "saved", "that", saved_city]
                     )
                     if use_saved:
-                        coords = await self._geocode_location(saved_location)
-                        if coords:
-                            lat, lon = coords["lat"], coords["lon"]
+                        saved_coords = await saved_lookup
+                        if saved_coords:
+                            lat, lon = saved_coords["lat"], saved_coords["lon"]
                         else:
                             await self.capability_worker.speak(
                                 f"Couldn't look up {saved_location}. Falling back to IP detection."
                             )
             if not lat or not lon:
-                await self.capability_worker.speak(
-                    "Detecting your location from your current IP address."
+                # Run the IP lookup while the notice is spoken
+                _, coords = await asyncio.gather(
+                    self.capability_worker.speak(
+                        "Detecting your location from your current IP address."
+                    ),
+                    self._detect_location_by_ip(),
                 )
-                coords = await self._detect_location_by_ip()
                 if coords:
                     lat = coords["lat"]
                     lon = coords["lon"]
@@ -1846,7 +2602,7 @@ class PetCareAssistantCapability(MatchingCapability):
                     self.pet_data["user_lon"] = lon
                     if coords.get("city"):
                         self.pet_data["user_location"] = coords["city"]
-                    await self._save_json(PETS_FILE, self.pet_data)
+                    self._schedule_pets_save()
                 else:
                     await self.capability_worker.speak(
                         "I couldn't detect your location automatically. "
@@ -1854,8 +2610,6 @@ class PetCareAssistantCapability(MatchingCapability):
                     )
                     return
 
-        await self.capability_worker.speak("Let me find emergency vets near you.")
-
         try:
             location_str = self.pet_data.get("user_location", "")
             query = (
@@ -1871,8 +2625,10 @@ class PetCareAssistantCapability(MatchingCapability):
             }
             payload = {"q": query, "num": 5}
 
-            resp = await asyncio.to_thread(
-                requests.post, url, headers=headers, json=payload, timeout=10
+            # Overlap the search round-trip with the spoken acknowledgement
+            _, resp = await asyncio.gather(
+                self.capability_worker.speak("Let me find emergency vets near you."),
+                self._http_request("POST", url, headers=headers, json=payload),
             )
 
             if resp.status_code == 401 or resp.status_code == 403:
@@ -1903,7 +2659,7 @@ class PetCareAssistantCapability(MatchingCapability):
                 return
 
             try:
-                data = resp.json()
+                data = await _decode_json(resp)
             except json.JSONDecodeError as e:
                 self.worker.editor_logging_handler.error(
                     f"[PetCare] Invalid JSON from Serper API: {e}"
@@ -1921,10 +2677,14 @@ class PetCareAssistantCapability(MatchingCapability):
                 )
                 return
 
-            # Open vets first, capped at 3
-            open_vets = [p for p in places if p.get("openNow")]
-            closed_vets = [p for p in places if not p.get("openNow")]
-            top_results = (open_vets + closed_vets)[:3]
+            # Open vets first, capped at MAX_VET_RESULTS. One pass, stopping as
+            # soon as enough open vets are found to fill the list.
+            open_vets, closed_vets = [], []
+            for p in places:
+                (open_vets if p.get("openNow") else closed_vets).append(p)
+                if len(open_vets) == MAX_VET_RESULTS:
+                    break
+            top_results = (open_vets + closed_vets)[:MAX_VET_RESULTS]
 
             names = [p.get("title", "Unknown") for p in top_results]
             count = len(top_results)
@@ -1942,44 +2702,50 @@ class PetCareAssistantCapability(MatchingCapability):
             # Score each result against the user's pick.
             # Uses three keyword tiers; if no confident match is found,
             # falls back to an LLM call to handle paraphrases and nicknames.
-            _generic = {
-                "vet",
-                "veterinary",
-                "animal",
-                "hospital",
-                "clinic",
-                "pet",
-                "the",
-                "and",
-                "of",
-                "a",
-            }
+            # Pick-side tokens are the same for every candidate; compute once.
+            pick_words = set(pick_lower.split()) - _VET_GENERIC_WORDS
+            pick_compact = pick_lower.translate(_WS_DELETE)
 
-            def _match_score(place):
+            # Title-side tokens, computed once per candidate
+            candidates = []
+            for place in top_results:
                 title = place.get("title", "").lower()
-                title_words = set(title.split()) - _generic
-                pick_words = set(pick_lower.split()) - _generic
+                candidates.append(
+                    (
+                        place,
+                        set(title.split()) - _VET_GENERIC_WORDS,
+                        title.translate(_WS_DELETE),
+                    )
+                )
+
+            def _match_score(title_words, title_compact):
                 if not pick_words:
                     return 0
                 # Tier 1: exact word overlap (highest confidence)
                 exact = len(title_words & pick_words)
                 # Tier 2: substring match — handles cases like "urgent" being
                 # contained within a single-word title such as "UrgentVet".
+                # Counted once per matching (pick word, title word) pair.
                 partial = sum(
                     1 for pw in pick_words for tw in title_words if pw in tw or tw in pw
                 )
                 # Tier 3: whole-title substring — catches business names written
                 # as one word when spaces are removed from the user's pick
-                title_compact = re.sub(r"\s+", "", title)
-                pick_compact = re.sub(r"\s+", "", pick_lower)
                 whole = 2 if pick_compact in title_compact else 0
                 return exact * 3 + partial * 2 + whole
 
-            best = max(top_results, key=_match_score)
-            best_score = _match_score(best)
+            # Score each candidate once; max() keeps the first of equal scores.
+            best_score, best = max(
+                ((_match_score(tw, tc), place) for place, tw, tc in candidates),
+                key=lambda sp: sp[0],
+            )
 
             if best_score == 0:
-                best = await self._llm_pick_vet(pick, top_results) or top_results[0]
+                best = (
+                    _local_pick_vet(pick_lower, top_results)
+                    or await self._llm_pick_vet(pick, top_results)
+                    or top_results[0]
+                )
             chosen = best
 
             name = chosen.get("title", "Unknown")
@@ -1994,14 +2760,14 @@ class PetCareAssistantCapability(MatchingCapability):
                 detail += ". No phone number listed"
             await self.capability_worker.speak(detail)
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             self.worker.editor_logging_handler.error(
                 "[PetCare] Serper Maps API timeout"
             )
             await self.capability_worker.speak(
                 "The vet search timed out. Check your internet connection and try again."
             )
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             self.worker.editor_logging_handler.error(
                 "[PetCare] Could not connect to Serper Maps API"
             )
@@ -2040,7 +2806,7 @@ class PetCareAssistantCapability(MatchingCapability):
             raw = await asyncio.to_thread(
                 self.capability_worker.text_to_text_response, prompt
             )
-            m = re.search(r"\d+", raw.strip())
+            m = _RE_INT.search(raw.strip())
             if m:
                 idx = int(m.group()) - 1
                 if 0 <= idx < len(candidates):
@@ -2061,9 +2827,12 @@ class PetCareAssistantCapability(MatchingCapability):
 
         lat = self.pet_data.get("user_lat")
         lon = self.pet_data.get("user_lon")
+        # Set when IP detection fills in the location; saved after the answer
+        # is spoken so the write stays off the critical path.
+        location_detected = False
 
         if not lat or not lon:
-            coords = await self._detect_location_by_ip()
+            coords = await self._resolve_location(self.pet_data.get("user_location"))
             if coords:
                 lat = coords["lat"]
                 lon = coords["lon"]
@@ -2071,7 +2840,7 @@ class PetCareAssistantCapability(MatchingCapability):
                 self.pet_data["user_lon"] = lon
                 if coords.get("city"):
                     self.pet_data["user_location"] = coords["city"]
-                await self._save_json(PETS_FILE, self.pet_data)
+                location_detected = True
             else:
                 await self.capability_worker.speak(
                     "I need your location to check the weather. "
@@ -2079,41 +2848,53 @@ class PetCareAssistantCapability(MatchingCapability):
                 )
                 return
 
-        await self.capability_worker.speak("Let me check the weather for you.")
+        preamble = "Let me check the weather for you."
 
         try:
-            url = "https://api.open-meteo.com/v1/forecast"
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "current": "temperature_2m,weather_code,wind_speed_10m",
-                "hourly": "uv_index",
-                "temperature_unit": "fahrenheit",
-                "wind_speed_unit": "mph",
-                "forecast_days": 1,
-            }
-
-            resp = await asyncio.to_thread(requests.get, url, params=params, timeout=10)
+            # ~1 km grid; a repeat question within WEATHER_CACHE_TTL is free
+            cache_key = ("weather", round(float(lat), 2), round(float(lon), 2))
+            weather_data = self._ttl_cache_get(cache_key)
+            if weather_data is not None:
+                await self.capability_worker.speak(preamble)
+            else:
+                url = "https://api.open-meteo.com/v1/forecast"
+                params = {
+                    "latitude": lat,
+                    "longitude": lon,
+                    # Every hourly variable is also offered as a current
+                    # value, so UV needs no hourly array.
+                    "current": "temperature_2m,weather_code,wind_speed_10m,uv_index",
+                    "temperature_unit": "fahrenheit",
+                    "wind_speed_unit": "mph",
+                }
 
-            if resp.status_code != 200:
-                self.worker.editor_logging_handler.error(
-                    f"[PetCare] Open-Meteo API returned error: {resp.status_code}"
+                # The forecast round trip overlaps the spoken preamble
+                _, resp = await asyncio.gather(
+                    self.capability_worker.speak(preamble),
+                    self._http_request("GET", url, params=params),
                 )
-                await self.capability_worker.speak(
-                    "The weather service returned an error. Try again later."
-                )
-                return
 
-            try:
-                weather_data = resp.json()
-            except json.JSONDecodeError as e:
-                self.worker.editor_logging_handler.error(
-                    f"[PetCare] Invalid JSON from Open-Meteo: {e}"
-                )
-                await self.capability_worker.speak(
-                    "The weather service returned invalid data. Try again later."
-                )
-                return
+                if resp.status_code != 200:
+                    self.worker.editor_logging_handler.error(
+                        f"[PetCare] Open-Meteo API returned error: {resp.status_code}"
+                    )
+                    await self.capability_worker.speak(
+                        "The weather service returned an error. Try again later."
+                    )
+                    return
+
+                try:
+                    weather_data = await _decode_json(resp)
+                except json.JSONDecodeError as e:
+                    self.worker.editor_logging_handler.error(
+                        f"[PetCare] Invalid JSON from Open-Meteo: {e}"
+                    )
+                    await self.capability_worker.speak(
+                        "The weather service returned invalid data. Try again later."
+                    )
+                    return
+                if weather_data.get("current"):
+                    self._ttl_cache_put(cache_key, weather_data, WEATHER_CACHE_TTL)
 
             current = weather_data.get("current")
             if not current:
@@ -2128,11 +2909,7 @@ class PetCareAssistantCapability(MatchingCapability):
             temp_f = current.get("temperature_2m", 0)
             wind_mph = current.get("wind_speed_10m", 0)
             weather_code = current.get("weather_code", 0)
-
-            hourly = weather_data.get("hourly", {})
-            uv_values = hourly.get("uv_index", [])
-            current_hour = datetime.now().hour
-            uv_index = uv_values[current_hour] if current_hour < len(uv_values) else 0
+            uv_index = current.get("uv_index") or 0
 
             weather_info = (
                 f"Temperature: {temp_f}F, Wind: {wind_mph} mph, "
@@ -2153,12 +2930,12 @@ class PetCareAssistantCapability(MatchingCapability):
             )
             await self.capability_worker.speak(response)
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             self.worker.editor_logging_handler.error("[PetCare] Weather API timeout")
             await self.capability_worker.speak(
                 "The weather check timed out. Check your internet connection and try again."
             )
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             self.worker.editor_logging_handler.error(
                 "[PetCare] Could not connect to Weather API"
             )
@@ -2172,12 +2949,18 @@ class PetCareAssistantCapability(MatchingCapability):
             await self.capability_worker.speak(
                 "An unexpected error occurred while checking the weather."
             )
+        finally:
+            if location_detected:
+                self._schedule_pets_save()
 
     # === Food Recall Checker ===
 
     async def _fetch_fda_events(self, species: str) -> list:
         """Fetch FDA adverse events for a specific species (non-blocking).
 
+        One limited request per species, so a burst of reports for one
+        species can't crowd the others out of the results.
+
         Args:
             species: Animal species (dog, cat, etc.)
 
@@ -2193,29 +2976,34 @@ class PetCareAssistantCapability(MatchingCapability):
                 "sort": "original_receive_date:desc",
             }
 
-            resp = await asyncio.to_thread(requests.get, url, params=params, timeout=10)
+            resp = await self._http_request("GET", url, params=params)
 
             if resp.status_code == 200:
                 try:
-                    data = resp.json()
+                    data = await _decode_json(resp)
                 except json.JSONDecodeError as e:
                     self.worker.editor_logging_handler.error(
                         f"[PetCare] Invalid JSON from FDA API: {e}"
                     )
                     return results
 
+                # One entry per brand. Results arrive newest first
+                # (sort=original_receive_date:desc), so the first report seen
+                # is the latest; repeats only add prompt tokens.
+                latest = {}
                 for r in data.get("results", []):
-                    products = r.get("product", [])
-                    for prod in products:
-                        brand = prod.get("brand_name", "Unknown brand")
-                        results.append(
-                            {
+                    date = r.get("original_receive_date", "unknown date")
+                    for prod in r.get("product", []):
+                        brand = prod.get("brand_name") or "Unknown brand"
+                        key = brand.lower()
+                        if key not in latest:
+                            latest[key] = {
                                 "source": "FDA",
                                 "species": species,
                                 "brand": brand,
-                                "date": r.get("original_receive_date", "unknown date"),
+                                "date": date,
                             }
-                        )
+                results.extend(latest.values())
             elif resp.status_code == 404:
                 # 404 is expected when no events exist for species
                 self.worker.editor_logging_handler.info(
@@ -2230,11 +3018,11 @@ class PetCareAssistantCapability(MatchingCapability):
                     f"[PetCare] FDA API returned {resp.status_code}"
                 )
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             self.worker.editor_logging_handler.error(
                 f"[PetCare] FDA API timeout for {species}"
             )
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             self.worker.editor_logging_handler.error(
                 f"[PetCare] Could not connect to FDA API for {species}"
             )
@@ -2245,11 +3033,11 @@ class PetCareAssistantCapability(MatchingCapability):
 
         return results
 
-    async def _fetch_serper_news(self, species_set: set) -> list:
+    async def _fetch_serper_news(self, species_list: list) -> list:
         """Fetch Serper News headlines for food recalls (non-blocking).
 
         Args:
-            species_set: Set of species to search for
+            species_list: Recall-supported species to search for (dog, cat)
 
         Returns:
             List of news headline dicts with source, title, snippet, date
@@ -2259,7 +3047,7 @@ class PetCareAssistantCapability(MatchingCapability):
         if SERPER_API_KEY == "your_serper_api_key_here":
             return headlines
 
-        species_labels = " or ".join(s for s in species_set if s in ("dog", "cat"))
+        species_labels = " or ".join(species_list)
         search_query = (
             f"pet food recall {species_labels} 2026"
             if species_labels
@@ -2267,20 +3055,19 @@ class PetCareAssistantCapability(MatchingCapability):
         )
 
         try:
-            news_resp = await asyncio.to_thread(
-                requests.post,
+            news_resp = await self._http_request(
+                "POST",
                 "https://google.serper.dev/news",
                 headers={
                     "X-API-KEY": SERPER_API_KEY,
                     "Content-Type": "application/json",
                 },
                 json={"q": search_query, "num": 5},
-                timeout=10,
             )
 
             if news_resp.status_code == 200:
                 try:
-                    news_data = news_resp.json()
+                    news_data = await _decode_json(news_resp)
                 except json.JSONDecodeError as e:
                     self.worker.editor_logging_handler.error(
                         f"[PetCare] Invalid JSON from Serper News: {e}"
@@ -2312,9 +3099,9 @@ class PetCareAssistantCapability(MatchingCapability):
                     f"[PetCare] Serper News returned {news_resp.status_code}"
                 )
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             self.worker.editor_logging_handler.error("[PetCare] Serper News timeout")
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             self.worker.editor_logging_handler.error(
                 "[PetCare] Could not connect to Serper News"
             )
@@ -2325,21 +3112,17 @@ class PetCareAssistantCapability(MatchingCapability):
 
         return headlines
 
-    async def _handle_food_recall(self):
-        """Check openFDA and Serper News for recent pet food recalls and adverse events.
-
-        Runs all API calls in parallel for better performance (~50-70% faster).
-        """
-        pets = self.pet_data.get("pets", [])
-        species_set = set(p.get("species", "").lower() for p in pets)
+    async def _fetch_recall_alerts(self, species_list: list) -> tuple[list, list]:
+        """Fetch FDA events and Serper News headlines in parallel.
 
-        await self.capability_worker.speak("Let me check for recent pet food alerts.")
+        Args:
+            species_list: Sorted recall-supported species of the user's pets
 
-        tasks = []
-        for species in species_set:
-            if species in ("dog", "cat"):
-                tasks.append(self._fetch_fda_events(species))
-        tasks.append(self._fetch_serper_news(species_set))
+        Returns:
+            (fda_results, news_headlines) tuple; either list may be empty.
+        """
+        tasks = [self._fetch_fda_events(species) for species in species_list]
+        tasks.append(self._fetch_serper_news(species_list))
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -2356,37 +3139,144 @@ class PetCareAssistantCapability(MatchingCapability):
             elif isinstance(last_result, Exception):
                 pass  # Logged in _fetch_serper_news
 
+        return all_results, news_headlines
+
+    async def _cached_recall(self, key: str, fetcher) -> tuple[list, list]:
+        """Return recall alerts from RECALL_CACHE_FILE if fetched today for key.
+
+        Otherwise awaits fetcher() and stores its result. Empty results are not
+        cached, since the fetchers also return empty lists when an API fails.
+
+        Args:
+            key: Cache key (sorted species of the user's pets)
+            fetcher: Zero-argument callable returning an awaitable of
+                (fda_results, news_headlines)
+        """
+        today = datetime.now(timezone.utc).date().isoformat()
+        cache = await self._load_json(RECALL_CACHE_FILE, default={})
+        if cache.get("date") == today and cache.get("key") == key:
+            self.worker.editor_logging_handler.info(
+                f"[PetCare] Recall cache hit: {key}"
+            )
+            fda, news = cache.get("value", [[], []])
+            return fda, news
+
+        fda, news = await fetcher()
+        if fda or news:
+            try:
+                await self._save_json(
+                    RECALL_CACHE_FILE,
+                    {"date": today, "key": key, "value": [fda, news]},
+                )
+            except Exception:
+                pass  # Logged in save_json; a cache miss next time is harmless
+        return fda, news
+
+    async def _handle_food_recall(self):
+        """Check openFDA and Serper News for recent pet food recalls and adverse events.
+
+        Runs all API calls in parallel for better performance (~50-70% faster).
+        """
+        pets = self.pet_data.get("pets", [])
+        species_list = sorted(self._recall_species)
+
+        # openFDA is only searched for dogs and cats, and news needs a Serper
+        # key; with neither there is nothing to fetch, so skip the preamble.
+        if not species_list and SERPER_API_KEY == "your_serper_api_key_here":
+            await self.capability_worker.speak(
+                "I can only check pet food alerts for dogs and cats right now, "
+                "so there's nothing to look up for your pets."
+            )
+            return
+
+        # The cache lookup and any FDA/news fetches overlap the preamble
+        _, (all_results, news_headlines) = await asyncio.gather(
+            self.capability_worker.speak("Let me check for recent pet food alerts."),
+            self._cached_recall(
+                ",".join(species_list),
+                lambda: self._fetch_recall_alerts(species_list),
+            ),
+        )
+
         if not all_results and not news_headlines:
             await self.capability_worker.speak(
                 "No new pet food alerts found recently. Looks clear."
             )
             return
 
+        # FDA-only results sharing no brand word with the feeding log are
+        # read out locally; the LLM summary would only say they don't apply.
+        # Feeding notes are free text ("fed purina kibble"), so any overlap
+        # with a significant brand word goes to the LLM to judge. Without
+        # feeding entries there is nothing to compare against.
+        feeding_words = set(
+            _strip_punct(
+                " ".join(
+                    e.get("details", "").lower()
+                    for e in self.activity_log
+                    if e.get("type") == "feeding"
+                )
+            ).split()
+        )
+        if all_results and not news_headlines and feeding_words:
+            brands = list(
+                dict.fromkeys(
+                    r["brand"] for r in all_results if r["brand"] != "Unknown brand"
+                )
+            )
+            brand_words = {
+                word
+                for b in brands
+                for word in _strip_punct(b.lower()).split()
+                if len(word) > 2 and word not in _BRAND_GENERIC_WORDS
+            }
+            if brands and feeding_words.isdisjoint(brand_words):
+                count = len(all_results)
+                await self.capability_worker.speak(
+                    f"I found {count} recent FDA report{'s' if count != 1 else ''}, "
+                    "but none mention a food you've logged. "
+                    f"Brands reported include {', '.join(brands[:3])}."
+                )
+                return
+
         pet_names = [p["name"] for p in pets]
         context_parts = []
         if all_results:
             context_parts.append(
-                f"Recent FDA adverse event reports:\n{json.dumps(all_results, indent=2)}"
+                f"Recent FDA adverse event reports:\n{_compact_json(all_results)}"
             )
         if news_headlines:
             context_parts.append(
-                f"Recent news headlines:\n{json.dumps(news_headlines, indent=2)}"
+                f"Recent news headlines:\n{_compact_json(news_headlines)}"
             )
 
         prompt = (
             "\n\n".join(context_parts) + "\n\n"
-            f"User's pets: {', '.join(pet_names)}\n"
-            "Summarize any recalls or safety concerns in 2-3 short spoken sentences. "
-            "Mention the brands involved if known. Don't be alarmist. "
-            "If nothing seems serious or relevant, say so clearly."
+            f"User's pets: {', '.join(pet_names)}"
         )
 
+        prompt_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        summaries = await self._get_recall_summary_cache()
+        cached = summaries.get(prompt_key)
+        if cached:
+            summaries.move_to_end(prompt_key)
+            await self.capability_worker.speak(cached)
+            return
+
         try:
             response = await asyncio.to_thread(
                 self.capability_worker.text_to_text_response,
                 prompt,
+                system_prompt=RECALL_SYSTEM_PROMPT,
             )
             await self.capability_worker.speak(response)
+            summaries[prompt_key] = response
+            while len(summaries) > MAX_RECALL_SUMMARIES:
+                summaries.popitem(last=False)
+            try:
+                await self._save_json(RECALL_SUMMARY_CACHE_FILE, summaries)
+            except Exception:
+                pass  # Logged in save_json; the in-memory copy still serves hits
         except Exception:
             # Fallback to simple count
             count = len(all_results) + len(news_headlines)
@@ -2395,6 +3285,15 @@ class PetCareAssistantCapability(MatchingCapability):
                 "from FDA and news sources. Want more details?"
             )
 
+    async def _get_recall_summary_cache(self) -> OrderedDict:
+        """Return the recall summary LRU, loading it from disk on first use."""
+        if self._recall_summary_cache is None:
+            stored = await self._load_json(RECALL_SUMMARY_CACHE_FILE, default={})
+            self._recall_summary_cache = OrderedDict(
+                stored if isinstance(stored, dict) else {}
+            )
+        return self._recall_summary_cache
+
     # === Edit Pet Info ===
 
     async def _handle_edit_pet(self, intent: dict):
@@ -2407,8 +3306,8 @@ class PetCareAssistantCapability(MatchingCapability):
             )
             new_pet = await self._collect_pet_info()
             if new_pet:
-                self.pet_data.setdefault("pets", []).append(new_pet)
-                await self._save_json(PETS_FILE, self.pet_data)
+                self._add_pet(new_pet)
+                self._schedule_pets_save()
                 await self.capability_worker.speak(
                     f"Awesome, {new_pet['name']} has been added to your pets!"
                 )
@@ -2425,12 +3324,15 @@ class PetCareAssistantCapability(MatchingCapability):
                 await self.capability_worker.speak("And their phone number?")
                 phone_input = await self.capability_worker.user_response()
                 if phone_input and not self.llm_service.is_exit(phone_input):
-                    vet_phone = await self.llm_service.extract_phone_number_async(
+                    vet_phone = _parse_phone_digits(
                         phone_input
-                    )
+                    ) or await self.llm_service.extract_phone_number_async(phone_input)
                     self.pet_data["vet_phone"] = vet_phone
+                    self.pet_data["vet_phone_spoken"] = _fmt_phone_for_speech(
+                        vet_phone
+                    )
 
-                await self._save_json(PETS_FILE, self.pet_data)
+                self._schedule_pets_save()
                 await self.capability_worker.speak(f"Updated your vet to {vet_name}.")
             else:
                 await self.capability_worker.speak(
@@ -2445,17 +3347,14 @@ class PetCareAssistantCapability(MatchingCapability):
                 )
                 weight_input = await self.capability_worker.user_response()
                 if weight_input and not self.llm_service.is_exit(weight_input):
-                    weight_str = await self.llm_service.extract_weight_async(
+                    weight_str = _parse_weight_lbs(
                         weight_input
-                    )
+                    ) or await self.llm_service.extract_weight_async(weight_input)
                     try:
                         new_weight = float(weight_str)
-                        for p in self.pet_data.get("pets", []):
-                            if p["id"] == pet["id"]:
-                                p["weight_lbs"] = new_weight
-                                break
-                        await self._save_json(PETS_FILE, self.pet_data)
-
+                        # _handle_log appends one activity line, updates
+                        # weight_lbs and schedules the debounced PETS_FILE
+                        # save, so each file is written at most once here.
                         weight_intent = {
                             "pet_name": pet["name"],
                             "activity_type": "weight",
@@ -2478,25 +3377,24 @@ class PetCareAssistantCapability(MatchingCapability):
                 update_input = await self.capability_worker.user_response()
                 if update_input and not self.llm_service.is_exit(update_input):
                     update_prompt = (
-                        f"The user wants to update {pet['name']}'s info. "
-                        f"Current info: {json.dumps(pet)}\n"
-                        f"User said: {update_input}\n\n"
-                        "Return ONLY valid JSON with the fields to update. "
-                        "Only include fields that should change. "
-                        "Possible fields: breed, birthday (YYYY-MM-DD), weight_lbs (number), "
-                        "allergies (array of strings), medications (array of objects with name and frequency)."
+                        f"Current info: {_compact_json(pet)}\n"
+                        f"User said: {update_input}"
                     )
                     try:
                         raw = await asyncio.to_thread(
                             self.capability_worker.text_to_text_response,
                             update_prompt,
+                            system_prompt=PET_UPDATE_SYSTEM_PROMPT,
+                        )
+                        updates = _coerce_pet_updates(
+                            json.loads(_strip_llm_fences(raw))
                         )
-                        updates = json.loads(_strip_json_fences(raw))
-                        for p in self.pet_data.get("pets", []):
-                            if p["id"] == pet["id"]:
-                                p.update(updates)
-                                break
-                        await self._save_json(PETS_FILE, self.pet_data)
+                        if not updates:
+                            raise ValueError(f"no updatable fields in {raw!r}")
+                        indexed = self._pet_index.get(pet["id"])
+                        if indexed is not None:
+                            indexed.update(updates)
+                        self._schedule_pets_save()
                         await self.capability_worker.speak(
                             f"Updated {pet['name']}'s info."
                         )
@@ -2517,13 +3415,17 @@ class PetCareAssistantCapability(MatchingCapability):
                     self.pet_data["pets"] = [
                         p for p in self.pet_data.get("pets", []) if p["id"] != pet["id"]
                     ]
-                    self.activity_log = [
+                    self._index_pets()
+                    self.activity_log = _activity_deque(
                         e for e in self.activity_log if e.get("pet_id") != pet["id"]
-                    ]
-                    await self._save_json(PETS_FILE, self.pet_data)
-                    await self._save_json(ACTIVITY_LOG_FILE, self.activity_log)
-                    await self.capability_worker.speak(
-                        f"{pet['name']} has been removed."
+                    )
+                    self._log_by_pet.pop(pet["id"], None)
+                    self._schedule_pets_save()
+                    await asyncio.gather(
+                        self._rewrite_activity_log(),
+                        self.capability_worker.speak(
+                            f"{pet['name']} has been removed."
+                        ),
                     )
                 else:
                     await self.capability_worker.speak(f"Okay, keeping {pet['name']}.")
@@ -2533,8 +3435,9 @@ class PetCareAssistantCapability(MatchingCapability):
                 "Clear all activity logs for all pets? This can't be undone. Say yes to confirm."
             )
             if confirmed:
-                self.activity_log = []
-                await self._save_json(ACTIVITY_LOG_FILE, self.activity_log)
+                self.activity_log = _activity_deque()
+                self._index_activity_log()
+                await self._rewrite_activity_log()
                 await self.capability_worker.speak(
                     "All activity logs have been cleared."
                 )
@@ -2548,24 +3451,34 @@ class PetCareAssistantCapability(MatchingCapability):
             )
             if confirmed:
                 self.pet_data = {}
-                self.activity_log = []
+                self._index_pets()
+                self.activity_log = _activity_deque()
+                self._index_activity_log()
                 self.reminders = []
+                self._reminders_dirty = False
+                self._pets_dirty = False
+                self._recall_summary_cache = None
+                self._geocode_cache = None
+                self._http_cache.clear()
                 # Delete files directly rather than writing empty data.
                 # Writing {} then {"pets": [...]} in quick succession triggers
                 # append-corruption on OpenHome (write_file appends, not overwrites).
                 # load_json returns the correct empty defaults when files are absent.
                 # Also delete .backup files so no stale data survives a fresh start.
-                for fname in (PETS_FILE, ACTIVITY_LOG_FILE, REMINDERS_FILE):
-                    for f in (fname, f"{fname}.backup"):
-                        try:
-                            if await self.capability_worker.check_if_file_exists(
-                                f, False
-                            ):
-                                await self.capability_worker.delete_file(f, False)
-                        except Exception as del_err:
-                            self.worker.editor_logging_handler.warning(
-                                f"[PetCare] Could not delete {f} during reset: {del_err}"
-                            )
+                paths = [
+                    f
+                    for fname in (
+                        PETS_FILE,
+                        ACTIVITY_LOG_FILE,
+                        LEGACY_ACTIVITY_LOG_FILE,
+                        REMINDERS_FILE,
+                        RECALL_CACHE_FILE,
+                        RECALL_SUMMARY_CACHE_FILE,
+                        GEOCODE_CACHE_FILE,
+                    )
+                    for f in (fname, f"{fname}.backup")
+                ]
+                await asyncio.gather(*(self._try_delete(f) for f in paths))
                 await self.capability_worker.speak(
                     "All data has been wiped. Let's start fresh."
                 )
@@ -2579,95 +3492,107 @@ class PetCareAssistantCapability(MatchingCapability):
                 "What would you like to do?"
             )
 
-    # === Reminders ===
+    async def _try_delete(self, filename: str):
+        """Delete a file if it exists, logging (not raising) on failure."""
+        try:
+            if await self.capability_worker.check_if_file_exists(filename, False):
+                await self.capability_worker.delete_file(filename, False)
+        except Exception as del_err:
+            self.worker.editor_logging_handler.warning(
+                f"[PetCare] Could not delete {filename} during reset: {del_err}"
+            )
 
-    _WEEKDAY_MAP = {
-        "monday": 0,
-        "tuesday": 1,
-        "wednesday": 2,
-        "thursday": 3,
-        "friday": 4,
-        "saturday": 5,
-        "sunday": 6,
-    }
+    # === Reminders ===
 
-    def _parse_reminder_time(self, time_description: str) -> datetime | None:
+    def _parse_reminder_time(
+        self, time_description: str, now: datetime | None = None
+    ) -> datetime | None:
         """Parse a natural language time description into a datetime using Python only.
 
         Supports: 'in X hours/minutes', 'at HH:MM', 'tomorrow at HH:MM',
-                  'next Monday at 5PM', 'on Friday', 'this Wednesday'.
+                  'next Monday at 5PM', 'on Friday', 'this Wednesday', and
+                  the fixed phrases in _FIXED_REMINDER_PHRASES.
+        Times are relative to ``now`` (default: the current local time).
         Returns None if unparseable.
         """
         if not time_description:
             return None
-        now = datetime.now()
         text = time_description.lower().strip()
+        spec = _FIXED_REMINDER_PHRASES.get(text.rstrip(".!?"))
+        if spec is None:
+            spec = self._reminder_time_spec(text)
+        if spec is None:
+            return None
+        if now is None:
+            now = datetime.now()
+        kind = spec[0]
 
-        # --- "in X minutes/hours" ---
-        m = re.search(r"in (\d+) minute", text)
-        if m:
-            return now + timedelta(minutes=int(m.group(1)))
-
-        m = re.search(r"in (\d+) hour", text)
-        if m:
-            return now + timedelta(hours=int(m.group(1)))
+        if kind == "delta":
+            return now + spec[1]
 
-        m = re.search(r"tomorrow.*?(\d{1,2})(?::(\d{2}))?\s*(am|pm)?", text)
-        if m:
-            hour, minute = self._parse_hm(m)
+        if kind == "tomorrow":
+            _, hour, minute = spec
             tomorrow = now + timedelta(days=1)
-            return tomorrow.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            return datetime(tomorrow.year, tomorrow.month, tomorrow.day, hour, minute)
 
-        day_pattern = "|".join(self._WEEKDAY_MAP.keys())
-        m = re.search(
-            rf"(?:next|this|on)\s+({day_pattern})"
-            rf"(?:.*?(\d{{1,2}})(?::(\d{{2}}))?\s*(am|pm)?)?",
-            text,
-        )
-        if m:
-            target_weekday = self._WEEKDAY_MAP[m.group(1)]
-            current_weekday = now.weekday()
-            days_ahead = (target_weekday - current_weekday) % 7
+        if kind == "weekday":
+            _, target_weekday, hour, minute = spec
+            days_ahead = (target_weekday - now.weekday()) % 7
             # "next X" when today is X means 7 days, not 0
             if days_ahead == 0:
                 days_ahead = 7
             target_date = now + timedelta(days=days_ahead)
-            if m.group(2):
-                hour, minute = self._parse_hm(m, groups=(2, 3, 4))
-            else:
-                hour, minute = 9, 0  # default 9 AM
-            return target_date.replace(
-                hour=hour, minute=minute, second=0, microsecond=0
+            return datetime(
+                target_date.year, target_date.month, target_date.day, hour, minute
             )
 
-        m = re.search(
-            rf"({day_pattern})" rf"(?:.*?(\d{{1,2}})(?::(\d{{2}}))?\s*(am|pm)?)?",
-            text,
-        )
-        if m:
-            target_weekday = self._WEEKDAY_MAP[m.group(1)]
-            current_weekday = now.weekday()
-            days_ahead = (target_weekday - current_weekday) % 7
-            if days_ahead == 0:
-                days_ahead = 7
-            target_date = now + timedelta(days=days_ahead)
-            if m.group(2):
-                hour, minute = self._parse_hm(m, groups=(2, 3, 4))
-            else:
-                hour, minute = 9, 0
-            return target_date.replace(
-                hour=hour, minute=minute, second=0, microsecond=0
-            )
+        if kind == "tonight":
+            _, hour, minute = spec
+            candidate = datetime(now.year, now.month, now.day, hour, minute)
+            return candidate if candidate > now else now + TONIGHT_LATE_DELAY
 
-        m = re.search(r"at (\d{1,2})(?::(\d{2}))?\s*(am|pm)?", text)
-        if m:
-            hour, minute = self._parse_hm(m)
-            candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if candidate <= now:
-                candidate += timedelta(days=1)
-            return candidate
+        # kind == "at"
+        _, hour, minute = spec
+        candidate = datetime(now.year, now.month, now.day, hour, minute)
+        if candidate <= now:
+            candidate += timedelta(days=1)
+        return candidate
 
-        return None
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _reminder_time_spec(text: str) -> tuple | None:
+        """Parse the clock-independent part of a reminder time description.
+
+        Memoized on the lowercased text — users repeat the same few phrases,
+        and only _parse_reminder_time's arithmetic depends on the current time.
+
+        Returns:
+            ("delta", timedelta), ("tomorrow", hour, minute),
+            ("weekday", weekday, hour, minute) or ("at", hour, minute);
+            None if the text matches no pattern.
+        """
+        m = _RE_REMINDER.match(text)
+        if not m:
+            return None
+        kind = m.lastgroup
+        parse_hm = PetCareAssistantCapability._parse_hm
+
+        if kind == "rel_min":
+            return ("delta", timedelta(minutes=int(m.group("min_n"))))
+        if kind == "rel_hr":
+            return ("delta", timedelta(hours=int(m.group("hr_n"))))
+        if kind == "tomorrow":
+            return ("tomorrow", *parse_hm(m, groups=("tom_h", "tom_m", "tom_ap")))
+        if kind in ("qday", "day"):
+            day_group = "qday_name" if kind == "qday" else "day_name"
+            if m.group(f"{kind}_h"):
+                hour, minute = parse_hm(
+                    m, groups=(f"{kind}_h", f"{kind}_m", f"{kind}_ap")
+                )
+            else:
+                hour, minute = 9, 0  # default 9 AM
+            return ("weekday", _WEEKDAY_MAP[m.group(day_group)], hour, minute)
+        return ("at", *parse_hm(m, groups=("at_h", "at_m", "at_ap")))
 
     @staticmethod
     def _parse_hm(m, groups=(1, 2, 3)) -> tuple[int, int]:
@@ -2676,6 +3601,7 @@ class PetCareAssistantCapability(MatchingCapability):
         Args:
             m: Regex match object
             groups: Tuple of (hour_group, minute_group, meridiem_group) indices
+                or names
 
         Returns:
             (hour, minute) tuple in 24-hour format
@@ -2694,20 +3620,132 @@ class PetCareAssistantCapability(MatchingCapability):
         """Announce and remove any reminders that are due or overdue."""
         if not self.reminders:
             return
-        now = datetime.now()
-        due = [
-            r
-            for r in self.reminders
-            if r.get("due_at") and datetime.fromisoformat(r["due_at"]) <= now
-        ]
-        if not due:
+        # Reminders are kept sorted by due_ts, so the due ones are a prefix
+        n_due = bisect.bisect_right(self.reminders, time.time(), key=_reminder_due_ts)
+        if not n_due:
             return
+        due, self.reminders = self.reminders[:n_due], self.reminders[n_due:]
         for r in due:
             await self.capability_worker.speak(
                 r.get("message", "You have a pet reminder due.")
             )
-        self.reminders = [r for r in self.reminders if r not in due]
-        await self._save_json(REMINDERS_FILE, self.reminders)
+        self._schedule_reminders_save()
+
+    def _schedule_reminders_save(self):
+        """Mark reminders changed and save them shortly, off the speak path.
+
+        Edits arriving while a flush is pending ride along with it, so a burst
+        of changes costs one write. run() flushes again on exit.
+        """
+        self._reminders_dirty = True
+        if not self._reminders_flush_pending:
+            self._reminders_flush_pending = True
+            self.worker.session_tasks.create(self._delayed_reminders_flush())
+
+    async def _delayed_reminders_flush(self):
+        await self.worker.session_tasks.sleep(REMINDER_SAVE_DELAY)
+        self._reminders_flush_pending = False
+        await self._flush_reminders()
+
+    async def _flush_reminders(self):
+        """Write REMINDERS_FILE if reminders changed since the last write."""
+        if self._reminders_save_lock is None:
+            return
+        async with self._reminders_save_lock:
+            if not self._reminders_dirty:
+                return
+            self._reminders_dirty = False
+            try:
+                await self._save_json(REMINDERS_FILE, self.reminders)
+            except Exception:
+                self._reminders_dirty = True  # Logged in save_json; retry on exit
+
+    def _schedule_pets_save(self):
+        """Mark pet_data changed and save it shortly, like reminders.
+
+        Several profile edits in one turn (a weight log plus a location
+        update, say) cost a single PETS_FILE write. run() flushes on exit.
+        """
+        self._pets_dirty = True
+        if not self._pets_flush_pending:
+            self._pets_flush_pending = True
+            self.worker.session_tasks.create(self._delayed_pets_flush())
+
+    async def _delayed_pets_flush(self):
+        await self.worker.session_tasks.sleep(PETS_SAVE_DELAY)
+        self._pets_flush_pending = False
+        await self._flush_pets()
+
+    async def _flush_pets(self):
+        """Write PETS_FILE if pet_data changed since the last write."""
+        if self._pets_save_lock is None:
+            return
+        async with self._pets_save_lock:
+            if not self._pets_dirty:
+                return
+            self._pets_dirty = False
+            try:
+                await self._save_json(PETS_FILE, self.pet_data)
+            except Exception:
+                self._pets_dirty = True  # Logged in save_json; retry on exit
+
+    def _match_reminders(self, pet_name: str | None, activity: str | None) -> list:
+        """Indexes of reminders matching the pet and/or activity named by the user.
+
+        Returns an empty list when neither is given ('other' counts as not
+        given), so the caller falls back to asking for a number.
+        """
+        pet = (pet_name or "").strip().lower()
+        act = (activity or "").strip().lower()
+        if act == "other":
+            act = ""
+        if not pet and not act:
+            return []
+        return [
+            i
+            for i, r in enumerate(self.reminders)
+            if (not pet or (r.get("pet_name") or "").lower() == pet)
+            and (
+                not act
+                or (r.get("activity") or "").lower() == act
+                or act in r.get("message", "").lower()
+            )
+        ]
+
+    def _reminder_lines(self) -> list[str]:
+        """Numbered spoken lines for the current reminders, one per reminder."""
+        return [
+            f"{i}. {r.get('message', 'Reminder')} — {self._reminder_spoken_time(r)}."
+            for i, r in enumerate(self.reminders, 1)
+        ]
+
+    @staticmethod
+    def _reminder_spoken_time(reminder: dict) -> str:
+        """Return the cached spoken due time, formatting legacy records once."""
+        spoken = reminder.get("spoken_time")
+        if not spoken:
+            spoken = datetime.fromisoformat(reminder["due_at"]).strftime(
+                REMINDER_SPOKEN_FORMAT
+            )
+            reminder["spoken_time"] = spoken
+        return spoken
+
+    def _backfill_reminder_timestamps(self):
+        """Add ``due_ts`` and ``spoken_time`` to reminders saved before them.
+
+        Each legacy ``due_at`` is parsed once here, for both fields. Also
+        restores due-time order, which files written by older versions
+        (insertion order) do not have.
+        """
+        for r in self.reminders:
+            if "due_ts" not in r and r.get("due_at"):
+                try:
+                    due_at = datetime.fromisoformat(r["due_at"])
+                except ValueError:
+                    continue
+                r["due_ts"] = due_at.timestamp()
+                r.setdefault("spoken_time", due_at.strftime(REMINDER_SPOKEN_FORMAT))
+        self.reminders.sort(key=_reminder_due_ts)
 
     async def _handle_reminder(self, intent: dict):
         """Handle set / list / delete reminder actions."""
@@ -2717,14 +3755,11 @@ class PetCareAssistantCapability(MatchingCapability):
             if not self.reminders:
                 await self.capability_worker.speak("You have no reminders set.")
                 return
-            await self.capability_worker.speak(
+            lines = [
                 f"You have {len(self.reminders)} reminder{'s' if len(self.reminders) != 1 else ''}."
-            )
-            for i, r in enumerate(self.reminders, 1):
-                due = datetime.fromisoformat(r["due_at"]).strftime("%A at %I:%M %p")
-                await self.capability_worker.speak(
-                    f"{i}. {r.get('message', 'Reminder')} — {due}."
-                )
+            ]
+            lines.extend(self._reminder_lines())
+            await self.capability_worker.speak(" ".join(lines))
 
         elif action == "delete":
             if not self.reminders:
@@ -2732,23 +3767,32 @@ class PetCareAssistantCapability(MatchingCapability):
                 return
             if len(self.reminders) == 1:
                 self.reminders = []
-                await self._save_json(REMINDERS_FILE, self.reminders)
+                self._schedule_reminders_save()
                 await self.capability_worker.speak("Reminder deleted.")
                 return
-            for i, r in enumerate(self.reminders, 1):
-                due = datetime.fromisoformat(r["due_at"]).strftime("%A at %I:%M %p")
+            # "Cancel Luna's walk reminder" names the reminder outright; only
+            # fall back to the numbered list when that is missing or ambiguous.
+            matches = self._match_reminders(
+                intent.get("pet_name"), intent.get("activity")
+            )
+            if len(matches) == 1:
+                removed = self.reminders.pop(matches[0])
+                self._schedule_reminders_save()
                 await self.capability_worker.speak(
-                    f"{i}. {r.get('message', 'Reminder')} — {due}."
+                    f"Deleted reminder: {removed.get('message', 'Reminder')}."
                 )
-            await self.capability_worker.speak("Which number would you like to delete?")
+                return
+            lines = self._reminder_lines()
+            lines.append("Which number would you like to delete?")
+            await self.capability_worker.speak(" ".join(lines))
             pick = await self.capability_worker.user_response()
             if pick and not self.llm_service.is_exit(pick):
-                m = re.search(r"\d+", pick)
+                m = _RE_INT.search(pick)
                 if m:
                     idx = int(m.group()) - 1
                     if 0 <= idx < len(self.reminders):
                         removed = self.reminders.pop(idx)
-                        await self._save_json(REMINDERS_FILE, self.reminders)
+                        self._schedule_reminders_save()
                         await self.capability_worker.speak(
                             f"Deleted reminder: {removed.get('message', 'Reminder')}."
                         )
@@ -2772,7 +3816,8 @@ class PetCareAssistantCapability(MatchingCapability):
                 )
                 time_description = await self.capability_worker.user_response() or ""
 
-            due_at = self._parse_reminder_time(time_description)
+            now = datetime.now()
+            due_at = self._parse_reminder_time(time_description, now)
             if not due_at:
                 await self.capability_worker.speak(
                     "I couldn't understand that time. Try 'in 2 hours', 'at 6 PM', or 'next Monday at 5 PM'."
@@ -2783,22 +3828,62 @@ class PetCareAssistantCapability(MatchingCapability):
             activity_part = f" {activity}" if activity else ""
             message = f"Reminder{pet_part}: {activity_part or 'pet care task'}.".strip()
 
+            spoken_time = due_at.strftime(REMINDER_SPOKEN_FORMAT)
             reminder = {
-                "id": str(uuid.uuid4()),
+                "id": f"rem_{secrets.token_hex(4)}",
                 "pet_name": pet_name,
                 "activity": activity,
                 "message": message,
                 "due_at": due_at.isoformat(),
-                "created_at": datetime.now().isoformat(),
+                "due_ts": due_at.timestamp(),
+                "spoken_time": spoken_time,
+                "created_at": now.isoformat(),
             }
-            self.reminders.append(reminder)
-            await self._save_json(REMINDERS_FILE, self.reminders)
+            bisect.insort(self.reminders, reminder, key=_reminder_due_ts)
+            self._schedule_reminders_save()
 
-            spoken_time = due_at.strftime("%A at %I:%M %p")
             await self.capability_worker.speak(
                 f"Got it. I'll remind you {spoken_time}: {message}"
             )
 
+    # === Helper: pet index ===
+
+    def _index_pets(self):
+        """Rebuild the pet id and name indexes and recall species from pet_data."""
+        self._pet_index = {p["id"]: p for p in self.pet_data.get("pets", [])}
+        # Lowercased name -> pet; the first pet wins on duplicate names, as
+        # with the old in-order scan
+        self._pets_by_name = {}
+        for p in self.pet_data.get("pets", []):
+            self._pets_by_name.setdefault(p["name"].lower(), p)
+        self._recall_species = (
+            frozenset(
+                p.get("species", "").lower() for p in self.pet_data.get("pets", [])
+            )
+            & RECALL_SPECIES
+        )
+
+    def _index_activity_log(self):
+        """Rebuild the per-pet index of recent entries from activity_log."""
+        self._log_by_pet = {}
+        for e in self.activity_log:
+            pet_logs = self._log_by_pet.get(e.get("pet_id"))
+            if pet_logs is None:
+                pet_logs = self._log_by_pet[e.get("pet_id")] = deque(
+                    maxlen=LOOKUP_LOG_LIMIT
+                )
+            if len(pet_logs) < LOOKUP_LOG_LIMIT:
+                pet_logs.append(e)
+
+    def _add_pet(self, pet: dict):
+        """Append a pet to pet_data and register it in the id and name indexes."""
+        self.pet_data.setdefault("pets", []).append(pet)
+        self._pet_index[pet["id"]] = pet
+        self._pets_by_name.setdefault(pet["name"].lower(), pet)
+        species = pet.get("species", "").lower()
+        if species in RECALL_SPECIES:
+            self._recall_species = self._recall_species | {species}
+
     # === Helper: resolve pet ===
 
     def _resolve_pet(self, pet_name: str) -> dict:
@@ -2806,7 +3891,9 @@ class PetCareAssistantCapability(MatchingCapability):
 
         Delegates to PetDataService.
         """
-        return self.pet_data_service.resolve_pet(self.pet_data, pet_name)
+        return self.pet_data_service.resolve_pet(
+            self.pet_data, pet_name, self._pets_by_name
+        )
 
     async def _resolve_pet_async(self, pet_name: str) -> dict:
         """Resolve a pet, asking the user if ambiguous.
@@ -2814,80 +3901,210 @@ class PetCareAssistantCapability(MatchingCapability):
         Delegates to PetDataService.
         """
         return await self.pet_data_service.resolve_pet_async(
-            self.pet_data, pet_name, self.llm_service.is_exit
+            self.pet_data, pet_name, self.llm_service.is_exit, self._pets_by_name
         )
 
+    # === Helper: HTTP ===
+
+    async def _http_request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request on the shared client, retrying transient failures.
+
+        Retries HTTP_RETRY_STATUSES and network errors up to HTTP_RETRIES
+        times, sleeping a random 0..HTTP_RETRY_BASE * 2**attempt seconds in
+        between. The final response is returned (or the final error raised),
+        so callers keep their own status and exception handling.
+        """
+        for attempt in range(HTTP_RETRIES + 1):
+            try:
+                resp = await self._http.request(method, url, **kwargs)
+            except httpx.NetworkError:
+                if attempt == HTTP_RETRIES:
+                    raise
+            else:
+                retryable = resp.status_code in HTTP_RETRY_STATUSES
+                if not retryable or attempt == HTTP_RETRIES:
+                    return resp
+            await self.worker.session_tasks.sleep(
+                random.uniform(0, HTTP_RETRY_BASE * 2**attempt)
+            )
+
     # === Helper: geolocation ===
 
+    def _start_lookup(self, coro) -> asyncio.Future:
+        """Run a lookup as a session task; await the future for its result.
+
+        The future resolves to None if the lookup raises or is cancelled, so
+        a caller waiting on it is never left hanging.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        async def run():
+            result = None
+            try:
+                result = await coro
+            finally:
+                if not future.done():
+                    future.set_result(result)
+
+        self.worker.session_tasks.create(run())
+        return future
+
     async def _detect_location_by_ip(self) -> dict:
         """Auto-detect location using ip-api.com from user's IP."""
         try:
             ip = self.worker.user_socket.client.host
-            resp = await asyncio.to_thread(
-                requests.get, f"http://ip-api.com/json/{ip}", timeout=5
+            cache_key = ("ip_location", ip)
+            cached = self._ttl_cache_get(cache_key)
+            if cached is not None:
+                return cached
+            resp = await self._http_request(
+                "GET",
+                f"http://ip-api.com/json/{ip}",
+                params={"fields": IP_API_FIELDS},
+                timeout=5,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = await _decode_json(resp)
                 if data.get("status") == "success":
-                    isp = data.get("isp", "").lower()
-                    cloud_indicators = [
-                        "amazon",
-                        "aws",
-                        "google",
-                        "microsoft",
-                        "azure",
-                        "digitalocean",
-                    ]
-                    if any(c in isp for c in cloud_indicators):
+                    if _RE_CLOUD_ISP.search(data.get("isp") or ""):
                         self.worker.editor_logging_handler.warning(
                             "[PetCare] Cloud IP detected, location may be inaccurate"
                         )
-                    return {
+                    coords = {
                         "lat": data.get("lat"),
                         "lon": data.get("lon"),
                         "city": f"{data.get('city', '')}, {data.get('regionName', '')}",
                     }
+                    self._ttl_cache_put(cache_key, coords, IP_LOCATION_CACHE_TTL)
+                    return coords
         except Exception as e:
             self.worker.editor_logging_handler.error(
                 f"[PetCare] IP geolocation error: {e}"
             )
         return None
 
+    async def _prefetch_location(self):
+        """Warm the geocode cache for the saved city in the background.
+
+        Nothing is saved: which location to use is still the user's choice
+        in _handle_emergency_vet, and a later lookup just hits the cache.
+        """
+        await self._geocode_location(self.pet_data["user_location"])
+
+    async def _resolve_location(self, hint: str | None) -> dict | None:
+        """Geocode the saved city, falling back to IP detection.
+
+        The saved city is what the user told us, so it wins whenever it
+        resolves; IP detection is only a guess (and unreliable on cloud
+        hosts), so it is consulted only when there is no usable hint.
+        """
+        if hint:
+            coords = await self._geocode_location(hint)
+            if coords:
+                return coords
+        return await self._detect_location_by_ip()
+
     async def _geocode_location(self, location_str: str) -> dict:
         """Convert a city name to lat/lon using Open-Meteo geocoding.
 
-        Uses in-memory cache to avoid redundant API calls within a session.
+        Results are cached in GEOCODE_CACHE_FILE so a known city costs no
+        network round-trip, even on the first query of a session. The
+        startup prefetch, weather and vet lookups can ask for the same city
+        at once; later callers wait on the first one's request.
         """
-        if location_str in self._geocode_cache:
+        geocode_cache = await self._get_geocode_cache()
+        # "Austin, TX" and " austin,  tx" are the same lookup.
+        cache_key = _RE_WHITESPACE.sub(" ", location_str.strip().lower())
+        if cache_key in geocode_cache:
             self.worker.editor_logging_handler.info(
                 f"[PetCare] Geocoding cache hit: {location_str}"
             )
-            return self._geocode_cache[location_str]
-
+            # Re-insert so eviction drops the least recently used city.
+            coords = geocode_cache[cache_key] = geocode_cache.pop(cache_key)
+            return coords
+
+        pending = self._geocode_inflight.get(cache_key)
+        if pending is not None:
+            # Shielded so a cancelled waiter doesn't cancel the shared result
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._geocode_inflight[cache_key] = future
+        coords = None
+        try:
+            coords = await self._fetch_geocode(
+                location_str, cache_key, geocode_cache
+            )
+        finally:
+            del self._geocode_inflight[cache_key]
+            future.set_result(coords)
+        return coords
+
+    async def _fetch_geocode(
+        self, location_str: str, cache_key: str, geocode_cache: dict
+    ) -> dict:
+        """Geocode a city over the network and add it to geocode_cache."""
         try:
             url = "https://geocoding-api.open-meteo.com/v1/search"
             # Strip state/region suffix for better API results
             city_only = location_str.split(",")[0].strip()
-            resp = await asyncio.to_thread(
-                requests.get, url, params={"name": city_only, "count": 1}, timeout=10
+            resp = await self._http_request(
+                "GET", url, params={"name": city_only, "count": 1}
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = await _decode_json(resp)
                 results = data.get("results", [])
                 if results:
                     coords = {
                         "lat": results[0]["latitude"],
                         "lon": results[0]["longitude"],
                     }
-                    self._geocode_cache[location_str] = coords
+                    geocode_cache[cache_key] = coords
+                    while len(geocode_cache) > MAX_GEOCODE_ENTRIES:
+                        del geocode_cache[next(iter(geocode_cache))]
                     self.worker.editor_logging_handler.info(
                         f"[PetCare] Geocoded {location_str} -> {coords['lat']}, {coords['lon']}"
                     )
+                    try:
+                        # write_file appends, so overlapping saves would
+                        # leave two JSON objects in one file
+                        async with self._geocode_lock:
+                            await self._save_json(GEOCODE_CACHE_FILE, geocode_cache)
+                    except Exception:
+                        pass  # Logged in save_json; the in-memory copy still serves hits
                     return coords
         except Exception as e:
             self.worker.editor_logging_handler.error(f"[PetCare] Geocoding error: {e}")
         return None
 
+    def _ttl_cache_get(self, key):
+        """Return a cached API response that has not expired, else None."""
+        hit = self._http_cache.get(key)
+        if hit is None:
+            return None
+        expires, value = hit
+        if time.monotonic() >= expires:
+            del self._http_cache[key]
+            return None
+        self._http_cache.move_to_end(key)
+        return value
+
+    def _ttl_cache_put(self, key, value, ttl: float):
+        """Cache an API response for ttl seconds, evicting the least recently used."""
+        self._http_cache[key] = (time.monotonic() + ttl, value)
+        self._http_cache.move_to_end(key)
+        while len(self._http_cache) > MAX_HTTP_CACHE_ENTRIES:
+            self._http_cache.popitem(last=False)
+
+    async def _get_geocode_cache(self) -> dict:
+        """Return the geocode cache, loading it from disk on first use."""
+        if self._geocode_cache is None:
+            async with self._geocode_lock:
+                # Another lookup may have loaded it while this one waited
+                if self._geocode_cache is None:
+                    stored = await self._load_json(GEOCODE_CACHE_FILE, default={})
+                    self._geocode_cache = stored if isinstance(stored, dict) else {}
+        return self._geocode_cache
+
     # === Persistence ===
 
     async def _load_json(self, filename: str, default=None):
@@ -2910,3 +4127,53 @@ class PetCareAssistantCapability(MatchingCapability):
             Exception: If write fails (backup file will remain)
         """
         return await self.pet_data_service.save_json(filename, data)
+
+    async def _load_activity_log(self) -> deque:
+        """Load the activity log newest-first, migrating the legacy JSON array.
+
+        Returns:
+            Up to MAX_LOG_ENTRIES entries, most recent first.
+        """
+        # Only the newest MAX_LOG_ENTRIES lines are kept, so only those are
+        # decoded; the file may hold up to twice that before compaction.
+        entries, self._activity_log_lines = await self.pet_data_service.load_jsonl(
+            ACTIVITY_LOG_FILE, tail=MAX_LOG_ENTRIES
+        )
+        if entries:
+            return _activity_deque(reversed(entries))
+
+        legacy = await self.pet_data_service.load_json(
+            LEGACY_ACTIVITY_LOG_FILE, default=[]
+        )
+        if not legacy:
+            return _activity_deque()
+        activity_log = _activity_deque(legacy[:MAX_LOG_ENTRIES])
+        self.activity_log = activity_log
+        await self._rewrite_activity_log()
+        await self.capability_worker.delete_file(LEGACY_ACTIVITY_LOG_FILE, False)
+        self.worker.editor_logging_handler.info(
+            f"[PetCare] Migrated {len(activity_log)} activity entries to {ACTIVITY_LOG_FILE}"
+        )
+        return activity_log
+
+    async def _append_activity(self, entry: dict):
+        """Append one entry to the activity log file, compacting when it grows.
+
+        The file is compacted back to the in-memory log once it holds twice
+        MAX_LOG_ENTRIES lines, so each log call writes one line instead of
+        re-serializing the whole log.
+        """
+        await self.pet_data_service.append_jsonl(ACTIVITY_LOG_FILE, entry)
+        self._activity_log_lines += 1
+        if self._activity_log_lines > 2 * MAX_LOG_ENTRIES:
+            try:
+                await self._rewrite_activity_log()
+            except Exception:
+                pass  # Logged in save_jsonl; the entry is already saved
+
+    async def _rewrite_activity_log(self):
+        """Rewrite the activity log file from the in-memory log (oldest first)."""
+        await self.pet_data_service.save_jsonl(
+            ACTIVITY_LOG_FILE, reversed(self.activity_log)
+        )
+        self._activity_log_lines = len(self.activity_log)